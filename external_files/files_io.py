@@ -3,7 +3,7 @@ Wrapper functions for reading and writing all external files (XML, palette, and
 """
 
 from pathlib import Path
-from wan_files.sprite import BaseSprite
+from wan_files.sprite import BaseSprite, intern_palette
 from .constants import ExternalFiles
 from .xml_reader import read_sprite_xml
 from .xml_writer import write_sprite_xml
@@ -30,7 +30,7 @@ def read_external_files(sprite_dir: Path) -> BaseSprite:
 
     imgs_dir = sprite_dir / ExternalFiles.IMGS_DIR
 
-    sprite.palette = read_palette(palette_file, imgs_dir)
+    sprite.palette = intern_palette(read_palette(palette_file, imgs_dir))
 
     import_frame_images(imgs_dir, sprite)
 
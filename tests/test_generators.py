@@ -41,6 +41,12 @@ Usage:
     # Keep output folders for manual inspection (skip cleanup)
     python tests/test_generators.py --keep-output
 
+    # Stop comparing a test case as soon as generated files are missing
+    python tests/test_generators.py --fail-fast
+
+    # Run mode tests serially instead of in parallel (default: one per CPU)
+    python tests/test_generators.py --jobs 1
+
 Test Data:
     The test uses demo frames from tests/demo-frames/ directory (default).
     Each subfolder represents a separate test case with PNG images and config.json.
@@ -50,94 +56,247 @@ Exit Codes:
     1 - One or more tests failed
 """
 
+import io
+import os
 import sys
 import time
 import shutil
+import hashlib
 import argparse
+import tempfile
+import functools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from PIL import Image
-import numpy as np
+
+try:
+    # orjson is optional, parsing falls back to the stdlib json module
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from generators import (
-    sg_process_multiple_folder,
-    sg_process_single_folder,
-    fg_process_multiple_folder,
-    fg_process_single_folder,
-)
-from data import read_file_to_bytes, read_json_file
+from data import read_file_to_bytes, write_bytes_to_file
 from tests.utils import (
-    SECTION_SEPARATOR,
+    print_section_header,
     print_step_header,
     safe_remove_folder,
+    fast_move,
+    remove_debug_folders,
     get_subfolders,
 )
 
 
+def get_palette_bytes(img):
+    """Get the RGB palette of an image as bytes, or None if it has no palette."""
+    img.load()
+    if img.palette is None:
+        return None
+    if img.palette.mode == "RGB":
+        return img.palette.tobytes()
+    palette = img.getpalette()
+    return bytes(palette) if palette is not None else None
+
+
+def decode_image(img_path: Path):
+    """Decode an image as palette-mode data: (size, pixel digest, palette bytes)."""
+    # Heavy imports are deferred until a comparison actually decodes an image
+    from PIL import Image
+    import numpy as np
+    import xxhash
+
+    with Image.open(img_path) as img:
+        if img.mode != "P":
+            img = img.convert("P")
+        pixels = np.asarray(img, dtype=np.uint8)
+        return img.size, xxhash.xxh3_128_digest(pixels), get_palette_bytes(img)
+
+
+# Originals preloaded by run_tests for pool workers, {path: cached result}
+_PRELOADED_ORIGINALS = {}
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_original_cached(path_str: str, mtime_ns: int, size: int):
+    """Decode an image, cached by path, modification time and size."""
+    return decode_image(Path(path_str))
+
+
+def decode_original_image(img_path: Path):
+    """Decode an original image, decoding it only once across test modes."""
+    preloaded = _PRELOADED_ORIGINALS.get(str(img_path))
+    if preloaded is not None:
+        return preloaded
+    stat = os.stat(img_path)
+    return _decode_original_cached(str(img_path), stat.st_mtime_ns, stat.st_size)
+
+
+# PNGs up to this size are checked for byte equality before decoding
+PNG_BYTES_PRECHECK_LIMIT = 8 * 1024 * 1024
+
+
 def compare_images(img1_path: Path, img2_path: Path):
     try:
-        with Image.open(img1_path) as img1, Image.open(img2_path) as img2:
-            if img1.size != img2.size:
-                return False
+        # Identical files need no decoding, only differing bytes are compared by pixels
+        size = os.path.getsize(img1_path)
+        if (
+            size <= PNG_BYTES_PRECHECK_LIMIT
+            and size == os.path.getsize(img2_path)
+            and read_file_to_bytes(img1_path) == read_file_to_bytes(img2_path)
+        ):
+            return True
 
-            if img1.mode != "P":
-                img1 = img1.convert("P")
-            if img2.mode != "P":
-                img2 = img2.convert("P")
+        size1, digest1, p1 = decode_original_image(img1_path)
+        size2, digest2, p2 = decode_image(img2_path)
+
+        if size1 != size2:
+            return False
 
-            arr1 = np.array(img1, dtype=np.uint8)
-            arr2 = np.array(img2, dtype=np.uint8)
-            if not np.array_equal(arr1, arr2):
+        if p1 and p2:
+            # Generated palette must start with the original one (padding is ignored)
+            # startswith also fails a shorter palette and compares without slicing
+            if not p2.startswith(p1):
                 return False
+        elif p1 != p2:
+            return False
 
-            p1 = img1.getpalette()
-            p2 = img2.getpalette()
-            if p1 and p2:
-                # Fail if generated palette is shorter than original
-                if len(p2) < len(p1):
-                    return False
-                # Compare only up to validity of original palette (ignore padding)
-                return p1 == p2[: len(p1)]
-            return p1 == p2
+        # Same size, so equal pixel digests mean equal pixel data
+        return digest1 == digest2
     except Exception as e:
         print(f"    [ERROR] Failed to compare {img1_path} and {img2_path}: {e}")
         return False
 
 
-def find_all_files(folder: Path, exclude_dirs=None):
-    exclude_dirs = exclude_dirs or set()
-    files = {}
-    folder_path = folder
-
-    if not folder_path.exists():
-        return files
-
-    for file_path in folder_path.rglob("*"):
-        if file_path.is_file():
-            # Check if file is inside any excluded directory
-            relative_path = file_path.relative_to(folder_path)
-            path_parts = relative_path.parts
-            if any(excluded_dir in path_parts for excluded_dir in exclude_dirs):
+def _scandir_recursive(root: str, exclude_dirs, rel_prefix: str = ""):
+    """Yield (relative_posix_path, absolute_path) for files under root.
+
+    Excluded directories are pruned before descending into them.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_symlink():
                 continue
-            files[relative_path.as_posix()] = file_path
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in exclude_dirs:
+                    continue
+                yield from _scandir_recursive(
+                    entry.path, exclude_dirs, f"{rel_prefix}{entry.name}/"
+                )
+            elif entry.is_file(follow_symlinks=False):
+                yield f"{rel_prefix}{entry.name}", entry.path
+
+
+# Folders skipped (not descended into) when comparing outputs
+COMPARE_EXCLUDE_DIRS = frozenset({"DEBUG"})
+
+
+def find_all_files(folder: Path, exclude_dirs=None):
+    """Map relative posix paths to absolute path strings for files under folder."""
+    exclude_dirs = frozenset(exclude_dirs or ())
+
+    if not folder.exists():
+        return {}
+
+    return dict(_scandir_recursive(str(folder), exclude_dirs))
+
+
+def load_frames_fixture(frames_dir: Path) -> dict:
+    """Read every file under frames_dir once into {relative_path: bytes}."""
+    return {
+        relative_path: read_file_to_bytes(file_path)
+        for relative_path, file_path in _scandir_recursive(str(frames_dir), set())
+    }
+
+
+def write_frames_fixture(fixture: dict, dest_dir: Path):
+    """Materialize a frames fixture as a folder tree under dest_dir."""
+    for relative_path, data in fixture.items():
+        file_path = dest_dir / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        write_bytes_to_file(file_path, data)
+
+
+def normalize_json_data(data):
+    """Drop keys that are expected to differ between original and generated JSON."""
+    if isinstance(data, dict):
+        return {k: v for k, v in data.items() if k != "frames_folder"}
+    return data
 
-    return files
+
+def load_json_bytes(raw: bytes):
+    """Parse JSON from raw bytes, returning None if it is not valid JSON."""
+    try:
+        return json_loads(raw)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _read_original_json_cached(path_str: str, mtime_ns: int):
+    """Read a JSON file as (raw bytes, normalized data), cached by path and mtime."""
+    raw = read_file_to_bytes(Path(path_str))
+    return raw, normalize_json_data(load_json_bytes(raw))
+
+
+def read_original_json(json_path: Path):
+    """Read original JSON as (raw bytes, normalized data), once across test modes."""
+    preloaded = _PRELOADED_ORIGINALS.get(str(json_path))
+    if preloaded is not None:
+        return preloaded
+    try:
+        mtime_ns = os.stat(json_path).st_mtime_ns
+    except OSError:
+        return None, None
+    return _read_original_json_cached(str(json_path), mtime_ns)
+
+
+def preload_originals(frames_dir: Path) -> dict:
+    """Decode every original PNG and read every original JSON under frames_dir.
+
+    Pool workers each run one mode in their own process, so their in-process
+    caches would never hit. The parent preloads the originals once and hands
+    the result to every worker through set_preloaded_originals.
+
+    Returns: {path: cached result}
+    """
+    preloaded = {}
+    for relative_path, file_path in _scandir_recursive(
+        str(frames_dir), COMPARE_EXCLUDE_DIRS
+    ):
+        ext = relative_path.lower()
+        try:
+            if ext.endswith(".png"):
+                preloaded[file_path] = decode_original_image(Path(file_path))
+            elif ext.endswith(".json"):
+                preloaded[file_path] = read_original_json(Path(file_path))
+        except Exception:
+            # Unreadable originals are left to the comparison, which reports them
+            continue
+    return preloaded
+
+
+def set_preloaded_originals(preloaded: dict):
+    """Pool worker initializer: look originals up in the parent's preloaded results."""
+    global _PRELOADED_ORIGINALS
+    _PRELOADED_ORIGINALS = preloaded
 
 
 def compare_json_files(json1_path: Path, json2_path: Path):
     try:
-        data1 = read_json_file(json1_path)
-        data2 = read_json_file(json2_path)
+        # Original JSON is shared across all modes, generated JSON changes per run
+        raw1, data1 = read_original_json(json1_path)
+        raw2 = read_file_to_bytes(json2_path)
+
+        # Byte-identical files need no parsing
+        if data1 is not None and raw1 == raw2:
+            return True
+
+        data2 = normalize_json_data(load_json_bytes(raw2))
 
         if data1 is None or data2 is None:
             return False
 
-        if isinstance(data1, dict) and isinstance(data2, dict):
-            data1_normalized = {k: v for k, v in data1.items() if k != "frames_folder"}
-            data2_normalized = {k: v for k, v in data2.items() if k != "frames_folder"}
-            return data1_normalized == data2_normalized
-
         return data1 == data2
     except Exception as e:
         print(
@@ -146,7 +305,32 @@ def compare_json_files(json1_path: Path, json2_path: Path):
         return False
 
 
-def compare_file(original_path: Path, generated_path: Path, relative_path: str):
+# Files up to this size are compared directly; larger ones are streamed through a hash
+SMALL_FILE_LIMIT = 64 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_streamed_digest(file_path: Path) -> bytes:
+    """Hash a file in fixed-size chunks so memory stays bounded."""
+    digest = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(file_path, "rb") as f:
+        while n := f.readinto(buffer):
+            digest.update(view[:n])
+    return digest.digest()
+
+
+def compare_binary_files(original_path: Path, generated_path: Path) -> bool:
+    size = os.path.getsize(original_path)
+    if size != os.path.getsize(generated_path):
+        return False
+    if size <= SMALL_FILE_LIMIT:
+        return read_file_to_bytes(original_path) == read_file_to_bytes(generated_path)
+    return get_streamed_digest(original_path) == get_streamed_digest(generated_path)
+
+
+def compare_file(original_path: str, generated_path: str, relative_path: str):
     ext = relative_path.lower()
 
     if ext.endswith(".png"):
@@ -155,26 +339,31 @@ def compare_file(original_path: Path, generated_path: Path, relative_path: str):
         matches = compare_json_files(original_path, generated_path)
     else:
         try:
-            matches = read_file_to_bytes(original_path) == read_file_to_bytes(
-                generated_path
-            )
+            matches = compare_binary_files(original_path, generated_path)
         except Exception as e:
             return False, f"    [ERROR] Failed to compare {relative_path}: {e}"
 
-    status = "matches" if matches else "does not match"
-    return matches, f"    [{'OK' if matches else 'FAIL'}] {relative_path} {status}"
+    # Only mismatches get a detail line, passing files are summarized by the caller
+    if matches:
+        return True, None
+    return False, f"    [FAIL] {relative_path} does not match"
 
 
-def compare_folders(original_folder: Path, generated_folder: Path, folder_name):
+def compare_folders(
+    original_folder: Path, generated_folder: Path, folder_name, fail_fast=False
+):
     # Exclude DEBUG folders from comparison
-    original_files = find_all_files(original_folder, exclude_dirs={"DEBUG"})
-    generated_files = find_all_files(generated_folder, exclude_dirs={"DEBUG"})
+    original_files = find_all_files(original_folder, exclude_dirs=COMPARE_EXCLUDE_DIRS)
+    generated_files = find_all_files(
+        generated_folder, exclude_dirs=COMPARE_EXCLUDE_DIRS
+    )
 
     details = []
     all_match = True
 
-    original_keys = set(original_files.keys())
-    generated_keys = set(generated_files.keys())
+    # dict_keys views support set operations directly, no intermediate set copies
+    original_keys = original_files.keys()
+    generated_keys = generated_files.keys()
 
     missing_in_generated = original_keys - generated_keys
     extra_in_generated = generated_keys - original_keys
@@ -190,15 +379,19 @@ def compare_folders(original_folder: Path, generated_folder: Path, folder_name):
             f"    [WARNING] Extra files in generated: {sorted(extra_in_generated)}"
         )
 
-    common_files = original_keys & generated_keys
+    # Structural mismatch already proves failure, skip per-file comparison
+    if fail_fast and missing_in_generated:
+        return False, details
+
+    common_files = sorted(original_keys & generated_keys)
     details.append(f"    [INFO] Comparing {len(common_files)} Files")
 
-    for relative_path in sorted(common_files):
+    for relative_path in common_files:
         matches, message = compare_file(
             original_files[relative_path], generated_files[relative_path], relative_path
         )
-        details.append(message)
         if not matches:
+            details.append(message)
             all_match = False
 
     return all_match, details
@@ -237,6 +430,9 @@ TEST_MODE_CONFIGS = [
 # All available test mode names (derived from TEST_MODE_CONFIGS)
 ALL_MODES = [m[0] for m in TEST_MODE_CONFIGS]
 
+# Mode config lookup by mode name
+MODE_CONFIG_BY_NAME = {m[0]: m for m in TEST_MODE_CONFIGS}
+
 
 def mode_uses_base_palette(mode_config):
     """Check if mode uses base palette."""
@@ -290,13 +486,34 @@ def get_base_sprite_properties(mode_config):
     }
 
 
+# Per-mode lookup table, built once so the properties dicts aren't rebuilt per run
+MODE_TABLE = {
+    mode_config[0]: {
+        "sprite_properties": get_sprite_properties(mode_config),
+        "base_sprite_properties": get_base_sprite_properties(mode_config),
+        "safe_name": mode_config[0].replace("+", "_"),
+    }
+    for mode_config in TEST_MODE_CONFIGS
+}
+
+
 def get_output_dir_name(mode_name: str, export_as_wan: bool) -> str:
     """Get the output directory name for a mode."""
-    safe_name = mode_name.replace("+", "_")
+    safe_name = MODE_TABLE[mode_name]["safe_name"]
     prefix = "isolated_wan" if export_as_wan else "generated_sprites"
     return f"{prefix}_{safe_name}"
 
 
+def get_kept_output_dir_name(mode_name: str, export_as_wan: bool) -> str:
+    """Get the --keep-output folder name for a parallel mode test.
+
+    Uses the raw mode name, since modes like 8bpp+base and 8bpp_base share
+    an output directory name.
+    """
+    prefix = "isolated_wan" if export_as_wan else "generated_sprites"
+    return f"{prefix}_{mode_name}"
+
+
 def get_sprite_output_name(
     subfolder_name: str, mode_config, export_as_wan: bool
 ) -> str:
@@ -312,13 +529,26 @@ def get_sprite_output_name(
         return f"{subfolder_name}_sprite"
 
 
-def cleanup_or_keep(output_dir: Path, mode_name: str, keep_output: bool, step_num: int):
-    """Handle cleanup or keep-output logic."""
+def cleanup_or_keep(
+    output_dir: Path,
+    mode_name: str,
+    keep_output: bool,
+    step_num: int,
+    kept_output_dir: Path = None,
+):
+    """Handle cleanup or keep-output logic.
+
+    With kept_output_dir, kept output is copied there since output_dir is discarded.
+    """
     if keep_output:
         print_step_header(
             step_num + 1,
             f"Skipping cleanup of {mode_name} folder (--keep-output)",
         )
+        if kept_output_dir is not None:
+            safe_remove_folder(kept_output_dir)
+            shutil.copytree(output_dir, kept_output_dir, dirs_exist_ok=True)
+            output_dir = kept_output_dir
         print(f"[INFO] Keeping {output_dir} for manual inspection")
     else:
         print_step_header(step_num + 1, f"Cleaning up {mode_name} folder")
@@ -337,8 +567,10 @@ def generate_base_sprites(
 
     Returns: dict mapping subfolder_name to base sprite path
     """
+    from generators import sg_process_single_folder
+
     base_sprite_paths = {}
-    base_sprite_props = get_base_sprite_properties(mode_config)
+    base_sprite_props = MODE_TABLE[mode_config[0]]["base_sprite_properties"]
     base_category = get_base_category(mode_config)
     ext = ".wan" if export_as_wan else ""
 
@@ -363,7 +595,7 @@ def generate_base_sprites(
                 / f"{subfolder_name}_base{ext if export_as_wan else '_sprite'}"
             )
             if src.exists():
-                shutil.move(src, dest)
+                fast_move(src, dest)
                 base_sprite_paths[subfolder_name] = dest
                 print(f"[INFO] Generated base sprite: {dest.name}")
         else:  # 8bpp_base
@@ -372,14 +604,12 @@ def generate_base_sprites(
                 src = subfolder_path / f"{subfolder_name}{suffix}{ext}"
                 dest = output_dir / f"{subfolder_name}{suffix}{ext}"
                 if src.exists():
-                    shutil.move(src, dest)
+                    fast_move(src, dest)
                     if suffix == "_image_base":
                         base_sprite_paths[subfolder_name] = dest
                     print(f"[INFO] Generated base sprite: {dest.name}")
 
-        # Cleanup DEBUG folder
-        debug_folder = subfolder_path / "DEBUG"
-        safe_remove_folder(debug_folder, f"DEBUG from {subfolder_name}")
+    remove_debug_folders(frames_dir, subfolders)
 
     return base_sprite_paths
 
@@ -410,7 +640,7 @@ def move_generated_outputs(
                 src = frames_dir / subfolder_name / f"{subfolder_name}{suffix}{ext}"
                 dest = output_dir / f"{subfolder_name}{suffix}{ext}"
                 if src.exists():
-                    shutil.move(src, dest)
+                    fast_move(src, dest)
                 else:
                     success = False
 
@@ -435,7 +665,7 @@ def move_generated_outputs(
             dest = output_dir / f"{subfolder_name}_sprite{ext}"
 
             if src.exists():
-                shutil.move(src, dest)
+                fast_move(src, dest)
                 print(f"[INFO] Moved {subfolder_name}_sprite{ext} to {output_dir.name}")
                 moved.append(subfolder_name)
             else:
@@ -463,6 +693,8 @@ def generate_frames_from_outputs(
 
     Handles 8bpp_base split files, base palette modes, and standard modes.
     """
+    from generators import fg_process_multiple_folder, fg_process_single_folder
+
     sprite_category = mode_config[1]
     uses_base = mode_uses_base_palette(mode_config)
     ext = ".wan" if export_as_wan else ""
@@ -505,6 +737,7 @@ def compare_and_record(
     mode_config,
     export_as_wan: bool,
     results_list: list,
+    fail_fast: bool = False,
 ) -> bool:
     """Compare generated frames with originals and record results.
 
@@ -549,7 +782,7 @@ def compare_and_record(
             continue
 
         success, details = compare_folders(
-            original_folder, generated_frames_folder, subfolder_name
+            original_folder, generated_frames_folder, subfolder_name, fail_fast
         )
 
         for detail in details:
@@ -576,6 +809,9 @@ def run_single_mode_test(
     keep_output: bool,
     results_list: list,
     timing_dict: dict = None,
+    fail_fast: bool = False,
+    original_frames_dir: Path = None,
+    kept_output_dir: Path = None,
 ) -> bool:
     """Run a single mode test (either WAN or External Files based).
 
@@ -586,9 +822,15 @@ def run_single_mode_test(
         export_as_wan: True for WAN test, False for External Files test
         keep_output: Whether to keep output folders
         results_list: List to append test results to
+        timing_dict: Optional dict to record mode duration in
+        fail_fast: Skip per-file comparison when generated files are missing
+        original_frames_dir: Unmodified frames to compare against (default: frames_dir)
+        kept_output_dir: Where --keep-output copies the output (default: keep it in place)
 
     Returns: True if all tests passed for this mode
     """
+    from generators import sg_process_multiple_folder
+
     mode_start_time = time.perf_counter()
     mode_name = mode_config[0]
     uses_base = mode_uses_base_palette(mode_config)
@@ -598,12 +840,9 @@ def run_single_mode_test(
     # Test type label
     test_type = "WAN" if export_as_wan else "External Files"
 
-    print(SECTION_SEPARATOR)
-    print(
+    print_section_header(
         f"Testing {test_type} Round-Trip [{mode_name}]: frames -> {'WAN' if export_as_wan else 'files'} -> frames"
     )
-    print(SECTION_SEPARATOR)
-    print()
 
     subfolders = get_subfolders(frames_dir)
     if not subfolders:
@@ -636,21 +875,15 @@ def run_single_mode_test(
         sg_process_multiple_folder,
         frames_dir,
         export_as_wan=export_as_wan,
-        sprite_properties=get_sprite_properties(mode_config),
+        sprite_properties=MODE_TABLE[mode_name]["sprite_properties"],
         error_message=f"Sprite generation failed ({mode_name})",
     ):
         return False
+    # DEBUG folders are never compared, drop them for the subfolders already in scope
+    remove_debug_folders(frames_dir, subfolders)
     print()
 
-    # Step 3: Cleanup DEBUG folders
-    step_num += 1
-    print_step_header(step_num, "Cleaning up DEBUG folders")
-    for subfolder_name in get_subfolders(frames_dir):
-        debug_folder = frames_dir / subfolder_name / "DEBUG"
-        safe_remove_folder(debug_folder, f"DEBUG folder from {subfolder_name}")
-    print()
-
-    # Step 4: Move outputs to isolated folder
+    # Step 3: Move outputs to isolated folder
     step_num += 1
     print_step_header(step_num, f"Moving outputs to isolated folder ({mode_name})")
     moved, move_passed = move_generated_outputs(
@@ -666,7 +899,7 @@ def run_single_mode_test(
     print(f"[OK] Moved {len(moved)} output(s) to {output_dir}")
     print()
 
-    # Step 5: Generate frames from outputs
+    # Step 4: Generate frames from outputs
     step_num += 1
     print_step_header(step_num, f"Generating frames from {output_type} ({mode_name})")
     generate_frames_from_outputs(
@@ -674,20 +907,26 @@ def run_single_mode_test(
     )
     print()
 
-    # Step 6: Compare with originals
+    # Step 5: Compare with originals
     step_num += 1
     print_step_header(
         step_num, f"Comparing generated frames with originals ({mode_name})"
     )
     compare_passed = compare_and_record(
-        moved, frames_dir, output_dir, mode_config, export_as_wan, results_list
+        moved,
+        original_frames_dir or frames_dir,
+        output_dir,
+        mode_config,
+        export_as_wan,
+        results_list,
+        fail_fast=fail_fast,
     )
     if not compare_passed:
         all_passed = False
     print()
 
-    # Step 7: Cleanup
-    cleanup_or_keep(output_dir, mode_name, keep_output, step_num)
+    # Step 6: Cleanup
+    cleanup_or_keep(output_dir, mode_name, keep_output, step_num, kept_output_dir)
     print()
 
     # Record timing
@@ -699,12 +938,96 @@ def run_single_mode_test(
     return all_passed
 
 
+def get_scratch_root(test_dir: Path) -> Path:
+    """Pick the folder for worker workspaces, preferring a RAM-backed tmpfs.
+
+    WANIMATION_TEST_TMP overrides the choice, otherwise /dev/shm is used on Linux
+    when writable, falling back to test_dir.
+    """
+    override = os.environ.get("WANIMATION_TEST_TMP")
+    if override:
+        return Path(override)
+    shm_dir = Path("/dev/shm")
+    if sys.platform.startswith("linux") and os.access(shm_dir, os.W_OK):
+        return shm_dir
+    return test_dir
+
+
+def run_isolated_mode_test(
+    mode_config,
+    frames_dir: Path,
+    frames_fixture: dict,
+    test_dir: Path,
+    export_as_wan: bool,
+    keep_output: bool,
+    fail_fast: bool,
+) -> tuple:
+    """Run a single mode test in a private workspace (process pool worker).
+
+    Generators write their outputs next to the input frames, and some modes share
+    an output folder name, so each worker gets its own copy of frames_dir and its
+    own output location under a unique workspace in the scratch root. The copy is
+    written from frames_fixture, which run_tests reads from disk once for all workers.
+    Outputs are compared against the untouched frames_dir, whose originals the
+    parent has already preloaded. With keep_output, the output is copied to a
+    per-mode folder in test_dir before the workspace is removed.
+
+    Returns: (passed, results_list, timing_dict, captured_output)
+    """
+    output_name = get_output_dir_name(mode_config[0], export_as_wan)
+    kept_output_dir = test_dir / get_kept_output_dir_name(mode_config[0], export_as_wan)
+    workspace = Path(
+        tempfile.mkdtemp(prefix=f"{output_name}_", dir=get_scratch_root(test_dir))
+    )
+    scratch_frames_dir = workspace / frames_dir.name
+    results_list = []
+    timing_dict = {}
+    output = io.StringIO()
+
+    with contextlib.redirect_stdout(output):
+        try:
+            write_frames_fixture(frames_fixture, scratch_frames_dir)
+            passed = run_single_mode_test(
+                mode_config,
+                scratch_frames_dir,
+                workspace,
+                export_as_wan=export_as_wan,
+                keep_output=keep_output,
+                results_list=results_list,
+                timing_dict=timing_dict,
+                fail_fast=fail_fast,
+                original_frames_dir=frames_dir,
+                kept_output_dir=kept_output_dir,
+            )
+        finally:
+            safe_remove_folder(workspace)
+
+    return passed, results_list, timing_dict, output.getvalue()
+
+
+def tally_results(title: str, results: list) -> tuple:
+    """Print one round-trip section of the summary in a single pass.
+
+    Returns: (passed_count, total_count)
+    """
+    print(f"\n{title}")
+    passed_count = 0
+    for subfolder_name, success, _ in results:
+        passed_count += success
+        print(f"  {'PASS' if success else 'FAIL'}: {subfolder_name}")
+
+    print(f"\nResults: {passed_count}/{len(results)} tests passed")
+    return passed_count, len(results)
+
+
 def run_tests(
     keep_output=False,
     test_files=True,
     test_wan=True,
     modes_to_test=None,
     frames_dir=None,
+    fail_fast=False,
+    jobs=None,
 ):
     if modes_to_test is None:
         modes_to_test = ALL_MODES
@@ -715,10 +1038,10 @@ def run_tests(
         print(f"[ERROR] Test directory not found: {frames_files_dir}")
         return False
 
-    print(SECTION_SEPARATOR)
-    print("Testing Generators...")
-    print(SECTION_SEPARATOR)
-    print()
+    print_section_header("Testing Generators...")
+
+    # Start from an empty decode cache; it is bounded but can hold a previous run
+    _decode_original_cached.cache_clear()
 
     # Start overall timing
     overall_start_time = time.perf_counter()
@@ -731,51 +1054,92 @@ def run_tests(
     all_wan_tests_passed = True
 
     # Filter to only requested modes
-    test_modes = [m for m in TEST_MODE_CONFIGS if m[0] in modes_to_test]
+    modes_set = frozenset(modes_to_test)
+    test_modes = [m for m in TEST_MODE_CONFIGS if m[0] in modes_set]
 
-    # ===================================================================
-    # External Files Based Round-Trip Test: frames -> external files -> frames
-    # ===================================================================
+    # Run plan: External Files round-trips (frames -> external files -> frames)
+    # followed by WAN round-trips (frames -> WAN -> frames)
+    plan = []
     if test_files:
-        for mode_config in test_modes:
-            passed = run_single_mode_test(
-                mode_config,
-                frames_files_dir,
-                test_dir,
-                export_as_wan=False,
-                keep_output=keep_output,
-                results_list=test_results,
-                timing_dict=timing_results,
-            )
-            if not passed:
-                all_files_tests_passed = False
-
-    # ===================================================================
-    # WAN Files Based Round-Trip Test: frames -> WAN -> frames
-    # ===================================================================
+        plan.extend((mode_config, False) for mode_config in test_modes)
     if test_wan:
-        for mode_config in test_modes:
+        plan.extend((mode_config, True) for mode_config in test_modes)
+
+    jobs = min(jobs or os.cpu_count() or 1, len(plan))
+    outcomes = {}
+
+    if jobs > 1:
+        # Modes are independent, run each in its own process on a private frames copy
+        # Source frames are read and originals decoded once here instead of once per worker
+        frames_fixture = load_frames_fixture(frames_files_dir)
+        preloaded = preload_originals(frames_files_dir)
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=set_preloaded_originals,
+            initargs=(preloaded,),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    run_isolated_mode_test,
+                    mode_config,
+                    frames_files_dir,
+                    frames_fixture,
+                    test_dir,
+                    export_as_wan,
+                    keep_output,
+                    fail_fast,
+                ): (mode_config, export_as_wan)
+                for mode_config, export_as_wan in plan
+            }
+            # Print each mode's buffered output as soon as it finishes
+            for future in as_completed(futures):
+                mode_config, export_as_wan = futures[future]
+                try:
+                    passed, rows, timing, output = future.result()
+                    sys.stdout.write(output)
+                except Exception as e:
+                    print(f"[ERROR] {mode_config[0]} test crashed: {e}")
+                    passed, rows, timing = False, [], {}
+                outcomes[(mode_config[0], export_as_wan)] = (passed, rows, timing)
+    else:
+        for mode_config, export_as_wan in plan:
+            rows = []
+            timing = {}
             passed = run_single_mode_test(
                 mode_config,
                 frames_files_dir,
                 test_dir,
-                export_as_wan=True,
+                export_as_wan=export_as_wan,
                 keep_output=keep_output,
-                results_list=wan_test_results,
-                timing_dict=timing_results,
+                results_list=rows,
+                timing_dict=timing,
+                fail_fast=fail_fast,
             )
+            outcomes[(mode_config[0], export_as_wan)] = (passed, rows, timing)
+
+    # Aggregate in plan order so the summary is stable regardless of completion order
+    for mode_config, export_as_wan in plan:
+        passed, rows, timing = outcomes[(mode_config[0], export_as_wan)]
+        timing_results.update(timing)
+        if export_as_wan:
+            wan_test_results.extend(rows)
             if not passed:
                 all_wan_tests_passed = False
+        else:
+            test_results.extend(rows)
+            if not passed:
+                all_files_tests_passed = False
 
     # Calculate overall duration
     overall_duration = time.perf_counter() - overall_start_time
 
+    # Release decoded originals now that all comparisons are done
+    _decode_original_cached.cache_clear()
+
     # ===================================================================
     # Final Test Summary
     # ===================================================================
-    print(SECTION_SEPARATOR)
-    print("Test Summary")
-    print(SECTION_SEPARATOR)
+    print_section_header("Test Summary", blank_line=False)
 
     all_tests_passed = True
     total_passed = 0
@@ -783,16 +1147,10 @@ def run_tests(
 
     # External Files Based test results
     if test_files:
-        passed_count = sum(1 for _, success, _ in test_results if success)
-        total_count = len(test_results)
-
-        print("\nExternal Files Based Round-Trip (frames -> external files -> frames):")
-        for subfolder_name, success, _ in test_results:
-            status = "PASS" if success else "FAIL"
-            print(f"  {status}: {subfolder_name}")
-
-        print(f"\nResults: {passed_count}/{total_count} tests passed")
-
+        passed_count, total_count = tally_results(
+            "External Files Based Round-Trip (frames -> external files -> frames):",
+            test_results,
+        )
         if not all_files_tests_passed:
             all_tests_passed = False
         total_passed += passed_count
@@ -800,20 +1158,13 @@ def run_tests(
 
     # WAN Files Based test results
     if test_wan:
-        wan_passed_count = sum(1 for _, success, _ in wan_test_results if success)
-        wan_total_count = len(wan_test_results)
-
-        print("\nWAN Files Based Round-Trip (frames -> WAN -> frames):")
-        for subfolder_name, success, _ in wan_test_results:
-            status = "PASS" if success else "FAIL"
-            print(f"  {status}: {subfolder_name}")
-
-        print(f"\nResults: {wan_passed_count}/{wan_total_count} tests passed")
-
+        passed_count, total_count = tally_results(
+            "WAN Files Based Round-Trip (frames -> WAN -> frames):", wan_test_results
+        )
         if not all_wan_tests_passed:
             all_tests_passed = False
-        total_passed += wan_passed_count
-        total_tests += wan_total_count
+        total_passed += passed_count
+        total_tests += total_count
 
     print()
 
@@ -839,6 +1190,70 @@ def run_tests(
         return False
 
 
+# Mode argument mappings: (cli_flag, dest_attr, mode_name, help_text)
+MODE_ARG_MAP = (
+    ("--4bpp", "mode_4bpp", "4bpp", "Test 4bpp mode (standard 4-bit sprites)."),
+    (
+        "--4bpp-tiles",
+        "mode_4bpp_tiles",
+        "4bpp+tiles",
+        "Test 4bpp+tiles mode (4bpp with tiles mode enabled).",
+    ),
+    (
+        "--4bpp-base",
+        "mode_4bpp_base",
+        "4bpp+base",
+        "Test 4bpp+base mode (4bpp with base palette).",
+    ),
+    (
+        "--4bpp-tiles-base",
+        "mode_4bpp_tiles_base",
+        "4bpp+tiles+base",
+        "Test 4bpp+tiles+base mode (4bpp with tiles and base palette).",
+    ),
+    ("--8bpp", "mode_8bpp", "8bpp", "Test 8bpp mode (256 color sprites)."),
+    (
+        "--8bpp-tiles",
+        "mode_8bpp_tiles",
+        "8bpp+tiles",
+        "Test 8bpp+tiles mode (8bpp with tiles mode enabled).",
+    ),
+    (
+        "--8bpp-base",
+        "mode_8bpp_base",
+        "8bpp+base",
+        "Test 8bpp+base mode (8bpp with base palette).",
+    ),
+    (
+        "--8bpp-tiles-base",
+        "mode_8bpp_tiles_base",
+        "8bpp+tiles+base",
+        "Test 8bpp+tiles+base mode (8bpp with tiles and base palette).",
+    ),
+    (
+        "--4bpp-base-sprite",
+        "mode_4bpp_base_sprite",
+        "4bpp_base",
+        "Test 4bpp_base mode (Base sprite generation category).",
+    ),
+    (
+        "--4bpp-tiles-base-sprite",
+        "mode_4bpp_tiles_base_sprite",
+        "4bpp_base+tiles",
+        "Test 4bpp_base+tiles mode (Base sprite category with tiles).",
+    ),
+    (
+        "--8bpp-base-sprite",
+        "mode_8bpp_base_sprite",
+        "8bpp_base",
+        "Test 8bpp_base mode (Base sprite generation category).",
+    ),
+)
+
+# (dest_attr, mode_name) pairs for turning parsed flags into the modes to test
+MODE_DEST_TO_NAME = tuple((dest, mode_name) for _, dest, mode_name, _ in MODE_ARG_MAP)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Test script for Wanimation Studio generators. Tests round-trip conversions."
@@ -848,6 +1263,17 @@ if __name__ == "__main__":
         action="store_true",
         help="Keep generated output folders (generated-sprites and isolated_wan_files) for manual inspection. Skips cleanup steps.",
     )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Skip per-file comparison for a test case as soon as generated files are missing.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of mode tests to run in parallel (default: CPU count). Use 1 to run serially.",
+    )
     parser.add_argument(
         "--test-files",
         action="store_true",
@@ -858,66 +1284,6 @@ if __name__ == "__main__":
         action="store_true",
         help="Run only the WAN files based test (frames -> WAN -> frames).",
     )
-    # Mode argument mappings: (cli_flag, dest_attr, mode_name, help_text)
-    MODE_ARG_MAP = [
-        ("--4bpp", "mode_4bpp", "4bpp", "Test 4bpp mode (standard 4-bit sprites)."),
-        (
-            "--4bpp-tiles",
-            "mode_4bpp_tiles",
-            "4bpp+tiles",
-            "Test 4bpp+tiles mode (4bpp with tiles mode enabled).",
-        ),
-        (
-            "--4bpp-base",
-            "mode_4bpp_base",
-            "4bpp+base",
-            "Test 4bpp+base mode (4bpp with base palette).",
-        ),
-        (
-            "--4bpp-tiles-base",
-            "mode_4bpp_tiles_base",
-            "4bpp+tiles+base",
-            "Test 4bpp+tiles+base mode (4bpp with tiles and base palette).",
-        ),
-        ("--8bpp", "mode_8bpp", "8bpp", "Test 8bpp mode (256 color sprites)."),
-        (
-            "--8bpp-tiles",
-            "mode_8bpp_tiles",
-            "8bpp+tiles",
-            "Test 8bpp+tiles mode (8bpp with tiles mode enabled).",
-        ),
-        (
-            "--8bpp-base",
-            "mode_8bpp_base",
-            "8bpp+base",
-            "Test 8bpp+base mode (8bpp with base palette).",
-        ),
-        (
-            "--8bpp-tiles-base",
-            "mode_8bpp_tiles_base",
-            "8bpp+tiles+base",
-            "Test 8bpp+tiles+base mode (8bpp with tiles and base palette).",
-        ),
-        (
-            "--4bpp-base-sprite",
-            "mode_4bpp_base_sprite",
-            "4bpp_base",
-            "Test 4bpp_base mode (Base sprite generation category).",
-        ),
-        (
-            "--4bpp-tiles-base-sprite",
-            "mode_4bpp_tiles_base_sprite",
-            "4bpp_base+tiles",
-            "Test 4bpp_base+tiles mode (Base sprite category with tiles).",
-        ),
-        (
-            "--8bpp-base-sprite",
-            "mode_8bpp_base_sprite",
-            "8bpp_base",
-            "Test 8bpp_base mode (Base sprite generation category).",
-        ),
-    ]
-
     # Add mode arguments dynamically
     for flag, dest, _, help_text in MODE_ARG_MAP:
         parser.add_argument(flag, dest=dest, action="store_true", help=help_text)
@@ -938,7 +1304,7 @@ if __name__ == "__main__":
         run_wan = args.test_wan
 
     # Build modes list from flags (default is all if none specified)
-    modes = [mode_name for _, dest, mode_name, _ in MODE_ARG_MAP if getattr(args, dest)]
+    modes = [mode_name for dest, mode_name in MODE_DEST_TO_NAME if getattr(args, dest)]
     if not modes:
         modes = ALL_MODES
 
@@ -956,5 +1322,7 @@ if __name__ == "__main__":
         test_wan=run_wan,
         modes_to_test=modes,
         frames_dir=frames_dir,
+        fail_fast=args.fail_fast,
+        jobs=args.jobs,
     )
     sys.exit(0 if success else 1)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Pytest entry point for the generator round-trip tests.
+
+Runs the same round-trips as tests/test_generators.py, but as one pytest case
+per (pipeline, mode) pair. Each case works on its own copy of the demo frames
+inside tmp_path, so cases can run in parallel with pytest-xdist.
+
+Requires the development dependencies: pip install -r requirements-dev.txt
+
+Usage:
+    # Run all cases in parallel (requires pytest-xdist)
+    python -m pytest -n auto tests/test_generators_pytest.py
+
+    # Run a single pipeline or mode
+    python -m pytest tests/test_generators_pytest.py -k "wan and 8bpp_base"
+
+    # Run all cases, in parallel when pytest-xdist is installed
+    python tests/test_generators_pytest.py
+"""
+
+import sys
+import shutil
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.test_generators import ALL_MODES, MODE_CONFIG_BY_NAME, run_single_mode_test
+
+DEMO_FRAMES_DIR = Path(__file__).parent / "demo-frames"
+
+
+@pytest.fixture(scope="session")
+def frames_dir():
+    """Source demo frames shared (read-only) by all cases."""
+    if not DEMO_FRAMES_DIR.exists():
+        pytest.skip(f"Test directory not found: {DEMO_FRAMES_DIR}")
+    return DEMO_FRAMES_DIR
+
+
+@pytest.mark.parametrize("mode", ALL_MODES)
+@pytest.mark.parametrize("pipeline", ["files", "wan"])
+def test_roundtrip(pipeline, mode, frames_dir, tmp_path):
+    # Generators write next to the input frames, so each case gets its own copy
+    case_frames_dir = tmp_path / "frames"
+    shutil.copytree(frames_dir, case_frames_dir)
+
+    results = []
+    passed = run_single_mode_test(
+        MODE_CONFIG_BY_NAME[mode],
+        case_frames_dir,
+        tmp_path,
+        export_as_wan=pipeline == "wan",
+        keep_output=False,
+        results_list=results,
+    )
+
+    failed = [name for name, success, _ in results if not success]
+    assert passed and not failed, f"Round-trip failed for: {failed or mode}"
+
+
+if __name__ == "__main__":
+    pytest_args = [__file__]
+    # Spread cases across all cores when pytest-xdist is installed
+    if importlib.util.find_spec("xdist") is not None:
+        pytest_args = ["-n", "auto"] + pytest_args
+    sys.exit(pytest.main(pytest_args))
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Pytest unit tests for the sprite data structures in wan_files/sprite.py.
+
+Requires the development dependencies: pip install -r requirements-dev.txt
+
+Usage:
+    python -m pytest tests/test_sprite_pytest.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wan_files.sprite import AnimationSequence, AnimFrame
+
+
+def _sequence(nbframes: int) -> AnimationSequence:
+    """Sequence whose frame durations are 0..nbframes-1, to tell frames apart."""
+    seq = AnimationSequence()
+    for i in range(nbframes):
+        seq.insert_frame(AnimFrame(frame_duration=i))
+    return seq
+
+
+def _durations(seq: AnimationSequence):
+    return [af.frame_duration for af in seq.frames]
+
+
+def test_remove_frames_keeps_order():
+    seq = _sequence(6)
+    seq.remove_frames([4, 1])
+    assert _durations(seq) == [0, 2, 3, 5]
+
+
+def test_remove_frames_negative_and_duplicate_indexes():
+    seq = _sequence(5)
+    # -1 and 4 name the same frame, 2 is listed twice, each frame is removed once
+    seq.remove_frames([-1, 4, 2, 2, -5])
+    assert _durations(seq) == [1, 3]
+
+
+@pytest.mark.parametrize("index", [5, -6])
+def test_remove_frames_out_of_range(index):
+    seq = _sequence(5)
+    with pytest.raises(IndexError):
+        seq.remove_frames([0, index])
+    # Indexes are checked before anything is removed
+    assert _durations(seq) == [0, 1, 2, 3, 4]
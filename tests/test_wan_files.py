@@ -7,6 +7,7 @@ This script tests WAN file integrity by:
 2. Moving extracted folders to isolated location
 3. Regenerating WAN from external files (batch)
 4. Comparing checksums (original vs regenerated)
+5. Checking that loads of one WAN file share a single palette array
 
 Usage:
     # Test all WAN files in tests/demo-wans/
@@ -18,18 +19,27 @@ Usage:
     # Test specific WAN file(s) from default folder
     python tests/test_wan_files.py d51p41a2.wan
 
+    # Run the batched serial steps instead of one process per file
+    python tests/test_wan_files.py --jobs 1
+
 Test Data:
     WAN files should be placed in tests/demo-wans/ directory (default).
-    The test creates temporary folders that are auto-cleaned after testing.
+    The test works in a temporary folder (system temp dir) that is auto-cleaned
+    after testing.
 
 Exit Codes:
     0 - All tests passed (checksums match)
     1 - One or more tests failed (checksums differ)
 """
 
+import io
+import os
 import sys
 import shutil
 import argparse
+import tempfile
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 script_dir = Path(__file__).parent
@@ -37,19 +47,150 @@ if str(script_dir.parent) not in sys.path:
     sys.path.insert(0, str(script_dir.parent))
 
 from generators import wan_transform_process_multiple, wan_transform_process_single
+from wan_files import extract_wan
+from wan_files.sprite import intern_palette
 from tests.utils import (
-    SECTION_SEPARATOR,
+    print_section_header,
     print_step_header,
     safe_remove_folder,
+    fast_move,
     get_file_checksum,
+    cached_checksum,
+    load_checksum_cache,
+    save_checksum_cache,
 )
 
 
-def run_tests(test_data_dir: Path, specific_files: list = None) -> dict:
-    """Run WAN round-trip tests with step-wise processing."""
-    isolated_dir = script_dir / "isolated_extracted"
+def run_file_roundtrip(wan_file: Path, work_root: Path) -> tuple:
+    """Extract and regenerate one WAN file in a private folder (process pool worker).
+
+    Returns: (regenerated_size, regenerated_checksum, captured_output),
+    with size and checksum None if no WAN was regenerated.
+    """
+    work_dir = Path(tempfile.mkdtemp(prefix=f"{wan_file.stem}_", dir=work_root))
+    output = io.StringIO()
+
+    try:
+        with contextlib.redirect_stdout(output):
+            # Extraction writes next to the WAN file, so work on a staged copy.
+            # A hard link would let any in-place write reach tests/demo-wans.
+            staged_wan = work_dir / wan_file.name
+            shutil.copyfile(wan_file, staged_wan)
+            wan_transform_process_single(staged_wan, generate=False)
+
+            # Regenerated WAN is inside {stem}_extracted/{stem}_extracted.wan
+            folder = work_dir / f"{wan_file.stem}_extracted"
+            if folder.is_dir():
+                wan_transform_process_single(folder, generate=True)
+            regenerated_wan = folder / f"{folder.name}.wan"
+
+        if not regenerated_wan.exists():
+            return None, None, output.getvalue()
+        return (
+            regenerated_wan.stat().st_size,
+            get_file_checksum(regenerated_wan),
+            output.getvalue(),
+        )
+    finally:
+        safe_remove_folder(work_dir)
+
+
+def run_parallel_roundtrips(
+    wan_files: list, work_root: Path, jobs: int, results: dict
+) -> None:
+    """Round-trip each WAN file in its own process, then compare checksums."""
+    # ===================================================================
+    # STEP 1: Extract and regenerate each WAN file in parallel
+    # ===================================================================
+    print_step_header(1, f"Extracting and regenerating WAN files ({jobs} workers)")
+
+    roundtrips = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(run_file_roundtrip, wan_file, work_root): wan_file
+            for wan_file in wan_files
+        }
+        # Print each file's buffered output as soon as it finishes
+        for future in as_completed(futures):
+            wan_file = futures[future]
+            try:
+                regenerated_size, regenerated_hash, output = future.result()
+                sys.stdout.write(output)
+            except Exception as e:
+                print(f"[ERROR] {wan_file.name} round-trip crashed: {e}")
+                regenerated_size, regenerated_hash = None, None
+            roundtrips[wan_file] = (regenerated_size, regenerated_hash)
+
+    print()
+
+    # ===================================================================
+    # STEP 2: Compare checksums
+    # ===================================================================
+    print_step_header(2, "Comparing checksums")
+
+    checksum_cache = load_checksum_cache()
+
+    for wan_file in wan_files:
+        wan_name = wan_file.name
+        regenerated_size, regenerated_hash = roundtrips[wan_file]
+
+        if regenerated_hash is None:
+            print(f"[FAIL] {wan_name} - Regenerated WAN not found")
+            results[wan_name] = False
+        elif wan_file.stat().st_size != regenerated_size:
+            print(f"[FAIL] {wan_name} - Size mismatch")
+            results[wan_name] = False
+        elif cached_checksum(wan_file, checksum_cache) == regenerated_hash:
+            print(f"[PASS] {wan_name}")
+            results[wan_name] = True
+        else:
+            print(f"[FAIL] {wan_name} - Checksum mismatch")
+            results[wan_name] = False
+
+    save_checksum_cache(checksum_cache)
+    print()
+
+
+def check_palette_interning(wan_file: Path) -> bool:
+    """Check that loads of one WAN file share a palette without freezing callers' arrays."""
+    print_section_header(f"Checking palette interning with {wan_file.name}")
+
+    first = extract_wan(wan_file)
+    second = extract_wan(wan_file)
+    if first.palette is not second.palette:
+        print("[FAIL] Two loads of the same WAN file hold separate palette arrays")
+        return False
+    if first.palette.flags.writeable:
+        print("[FAIL] Shared palette array is writable")
+        return False
+
+    # Interning a caller's array must freeze a private copy, not the array itself
+    palette = first.palette.copy()
+    if intern_palette(palette) is not first.palette:
+        print("[FAIL] Equal palette was not interned to the shared array")
+        return False
+    if not palette.flags.writeable:
+        print("[FAIL] Interning made the caller's palette array read-only")
+        return False
+
+    print("[PASS] Palette interning")
+    print()
+    return True
+
+
+def run_tests(
+    test_data_dir: Path, specific_files: list = None, jobs: int = None
+) -> dict:
+    """Run WAN round-trip tests with step-wise processing.
+
+    With more than one job (default: one per CPU), each file is round-tripped in its
+    own process. With jobs=1, all files go through the batched extract/regenerate steps.
+    """
+    # One scratch folder for the whole run, typically on tmpfs under the system temp dir
+    isolated_dir = Path(tempfile.mkdtemp(prefix="wan_test_")) / "isolated_extracted"
 
     results = {}
+    cleanup_step = 5
 
     try:
         # Get WAN files to test
@@ -72,13 +213,14 @@ def run_tests(test_data_dir: Path, specific_files: list = None) -> dict:
             results["_no_files"] = False
             return results
 
-        print(SECTION_SEPARATOR)
-        print(f"Testing {len(wan_files)} WAN file(s)")
-        print(SECTION_SEPARATOR)
-        print()
+        print_section_header(f"Testing {len(wan_files)} WAN file(s)")
 
-        # Cleanup any existing isolated folder
-        safe_remove_folder(isolated_dir)
+        jobs = min(jobs or os.cpu_count() or 1, len(wan_files))
+        if jobs > 1:
+            # Files are independent, round-trip each one in its own process
+            cleanup_step = 3
+            run_parallel_roundtrips(wan_files, isolated_dir.parent, jobs, results)
+            return results
 
         # ===================================================================
         # STEP 1: Extract WAN files to folders
@@ -106,13 +248,17 @@ def run_tests(test_data_dir: Path, specific_files: list = None) -> dict:
         extracted_folders = sorted(
             f for f in test_data_dir.glob("*_extracted") if f.name in expected_folders
         )
-        moved_folders = []
-
-        for folder in extracted_folders:
-            dest_folder = isolated_dir / folder.name
-            shutil.move(folder, dest_folder)
-            moved_folders.append(folder.name)
-            print(f"[OK] Moved {folder.name}")
+        # Same-filesystem moves are single renames, the pool only pays off when
+        # fast_move has to fall back to copying across filesystems
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(
+                    fast_move,
+                    extracted_folders,
+                    [isolated_dir / folder.name for folder in extracted_folders],
+                )
+            )
+        print(f"[INFO] Moved {len(extracted_folders)} folder(s) to {isolated_dir.name}")
 
         # Check for expected folders that weren't extracted
         extracted_names = {f.name for f in extracted_folders}
@@ -123,7 +269,6 @@ def run_tests(test_data_dir: Path, specific_files: list = None) -> dict:
                 )
                 results[wan_file.name] = False
 
-        print(f"\n[INFO] Moved {len(moved_folders)} folder(s) to {isolated_dir.name}")
         print()
 
         # ===================================================================
@@ -140,22 +285,37 @@ def run_tests(test_data_dir: Path, specific_files: list = None) -> dict:
         # ===================================================================
         print_step_header(4, "Comparing checksums")
 
-        for wan_file in wan_files:
-            wan_name = wan_file.name
-            wan_stem = wan_file.stem
+        # Originals rarely change between runs, reuse their checksums when unchanged
+        checksum_cache = load_checksum_cache()
 
+        pairs = []
+        for wan_file in wan_files:
             # Regenerated WAN is inside {stem}_extracted/{stem}_extracted.wan
-            folder = isolated_dir / f"{wan_stem}_extracted"
+            folder = isolated_dir / f"{wan_file.stem}_extracted"
             regenerated_wan = folder / f"{folder.name}.wan"
 
             if not regenerated_wan.exists():
-                print(f"[FAIL] {wan_name} - Regenerated WAN not found")
-                results[wan_name] = False
+                print(f"[FAIL] {wan_file.name} - Regenerated WAN not found")
+                results[wan_file.name] = False
+                continue
+
+            # Different sizes already prove a mismatch, skip hashing both files
+            if wan_file.stat().st_size != regenerated_wan.stat().st_size:
+                print(f"[FAIL] {wan_file.name} - Size mismatch")
+                results[wan_file.name] = False
                 continue
+            pairs.append((wan_file, regenerated_wan))
 
-            orig_hash = get_file_checksum(wan_file)
-            gen_hash = get_file_checksum(regenerated_wan)
+        # hashlib releases the GIL while hashing, so threads hash files concurrently
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            orig_hashes = executor.map(
+                lambda pair: cached_checksum(pair[0], checksum_cache), pairs
+            )
+            gen_hashes = executor.map(lambda pair: get_file_checksum(pair[1]), pairs)
+            checksums = list(zip(orig_hashes, gen_hashes))
 
+        for (wan_file, _), (orig_hash, gen_hash) in zip(pairs, checksums):
+            wan_name = wan_file.name
             if orig_hash == gen_hash:
                 print(f"[PASS] {wan_name}")
                 results[wan_name] = True
@@ -163,6 +323,7 @@ def run_tests(test_data_dir: Path, specific_files: list = None) -> dict:
                 print(f"[FAIL] {wan_name} - Checksum mismatch")
                 results[wan_name] = False
 
+        save_checksum_cache(checksum_cache)
         print()
 
     except Exception as e:
@@ -174,10 +335,10 @@ def run_tests(test_data_dir: Path, specific_files: list = None) -> dict:
 
     finally:
         # ===================================================================
-        # STEP 5: Cleanup
+        # STEP 5 (STEP 3 when parallel): Cleanup
         # ===================================================================
-        print_step_header(5, "Cleaning up isolated folder")
-        safe_remove_folder(isolated_dir, str(isolated_dir))
+        print_step_header(cleanup_step, "Cleaning up isolated folder")
+        safe_remove_folder(isolated_dir.parent, str(isolated_dir.parent))
         print()
 
     return results
@@ -193,6 +354,13 @@ if __name__ == "__main__":
         help="Folder path or specific WAN files to test. If a directory is given, tests all WAN files in it. If not specified, uses tests/demo-wans",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of WAN files to round-trip in parallel (default: one per CPU, 1 runs the batched serial steps).",
+    )
+
     args = parser.parse_args()
 
     # Determine test data directory and files to test
@@ -214,14 +382,22 @@ if __name__ == "__main__":
         print(f"Directory not found: {test_data_dir}")
         sys.exit(1)
 
-    results = run_tests(test_data_dir, specific_files if specific_files else None)
+    results = run_tests(
+        test_data_dir, specific_files if specific_files else None, jobs=args.jobs
+    )
+
+    # Palette interning only needs one WAN file, use the first one under test
+    palette_wan = next(
+        (test_data_dir / f for f in specific_files if (test_data_dir / f).exists()),
+        next(iter(sorted(test_data_dir.glob("*.wan"))), None),
+    )
+    if palette_wan is not None:
+        results["palette interning"] = check_palette_interning(palette_wan)
 
     # ===================================================================
     # Summary
     # ===================================================================
-    print(SECTION_SEPARATOR)
-    print("Test Summary")
-    print(SECTION_SEPARATOR)
+    print_section_header("Test Summary", blank_line=False)
 
     passed = sum(1 for r in results.values() if r)
     total = len(results)
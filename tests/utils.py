@@ -1,21 +1,35 @@
 """Common utility functions for test scripts."""
 
+import os
+import sys
+import mmap
+import errno
 import hashlib
 import shutil
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-from data import read_file_to_bytes, SEPARATOR_LINE_LENGTH
+from data import SEPARATOR_LINE_LENGTH, read_json_file, write_json_file
 
 STEP_SEPARATOR = "-" * SEPARATOR_LINE_LENGTH
 SECTION_SEPARATOR = "=" * SEPARATOR_LINE_LENGTH
+CHECKSUM_CACHE_PATH = Path(__file__).parent / ".checksum_cache.json"
+
+# Resolved once instead of on every checksum call
+_SHA256 = hashlib.sha256
 
 
 def print_step_header(step_num, title):
     """Print a formatted step header."""
-    print(STEP_SEPARATOR)
-    print(f"[STEP {step_num}] {title}...")
-    print(STEP_SEPARATOR)
-    print()
+    sys.stdout.write(
+        f"{STEP_SEPARATOR}\n[STEP {step_num}] {title}...\n{STEP_SEPARATOR}\n\n"
+    )
+
+
+def print_section_header(title, blank_line=True):
+    """Print a formatted section banner, optionally followed by a blank line."""
+    trailer = "\n" if blank_line else ""
+    sys.stdout.write(f"{SECTION_SEPARATOR}\n{title}\n{SECTION_SEPARATOR}\n{trailer}")
 
 
 def safe_remove_folder(folder_path: Path, description=""):
@@ -33,10 +47,90 @@ def safe_remove_folder(folder_path: Path, description=""):
         return False
 
 
+def fast_move(src: Path, dest: Path):
+    """Move a file or folder with a single rename, copying only across filesystems."""
+    try:
+        os.replace(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dest))
+
+
+def remove_debug_folders(base_dir: Path, subfolders=None) -> int:
+    """Remove every <subfolder>/DEBUG folder under base_dir in one sweep.
+
+    When subfolders (names under base_dir) is given, only those are checked
+    instead of globbing base_dir again. Returns the number of DEBUG folders removed.
+    """
+    if subfolders is None:
+        debug_dirs = [p for p in base_dir.glob("*/DEBUG") if p.is_dir()]
+    else:
+        debug_dirs = [base_dir / name / "DEBUG" for name in subfolders]
+        debug_dirs = [p for p in debug_dirs if p.is_dir()]
+    if not debug_dirs:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        removed = list(executor.map(safe_remove_folder, debug_dirs))
+
+    for debug_dir, ok in zip(debug_dirs, removed):
+        if not ok:
+            print(
+                f"[WARNING] Failed to remove DEBUG folder from {debug_dir.parent.name}"
+            )
+    removed_count = sum(removed)
+    if removed_count:
+        print(f"[OK] Cleaned DEBUG in {removed_count} folder(s)")
+    return removed_count
+
+
 def get_file_checksum(file_path: Path) -> str:
-    """Get SHA256 checksum of a file."""
-    data = read_file_to_bytes(file_path)
-    return hashlib.sha256(data).hexdigest()
+    """Get SHA256 checksum of a file, hashed straight from a read-only memory map."""
+    with open(file_path, "rb") as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return _SHA256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _SHA256(mapped).hexdigest()
+
+
+def load_checksum_cache(cache_path: Path = CHECKSUM_CACHE_PATH) -> dict:
+    """Load the checksum cache sidecar, or an empty cache if missing or unreadable."""
+    cache = read_json_file(cache_path)
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_checksum_cache(cache: dict, cache_path: Path = CHECKSUM_CACHE_PATH):
+    """Write the checksum cache sidecar, ignoring failures (the cache is optional)."""
+    try:
+        write_json_file(cache_path, cache)
+    except OSError as e:
+        print(f"[WARNING] Failed to save checksum cache: {e}")
+
+
+def cached_checksum(file_path: Path, cache: dict) -> str:
+    """Get SHA256 checksum of a file, reusing the cached value if it is unchanged.
+
+    Entries are keyed by resolved path and invalidated by mtime or size changes.
+    """
+    stat = file_path.stat()
+    key = str(file_path.resolve())
+    entry = cache.get(key)
+    if (
+        entry
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+        and entry.get("size") == stat.st_size
+    ):
+        return entry["sha256"]
+
+    checksum = get_file_checksum(file_path)
+    cache[key] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": checksum,
+    }
+    return checksum
 
 
 def get_subfolders(base_dir: Path):
@@ -2,6 +2,8 @@
 WAN file format constants.
 """
 
+from types import MappingProxyType
+
 PADDING_BYTE = 0xAA
 
 
@@ -34,15 +36,20 @@ class MetaFrameRes:
         0x8C: (32, 64),
     }
 
-    RESOLUTION_TO_ENUM = {v: k for k, v in RESOLUTION_MAP.items()}
+    RESOLUTION_TO_ENUM = MappingProxyType({v: k for k, v in RESOLUTION_MAP.items()})
 
 
-CHUNK_SIZES = sorted(
-    MetaFrameRes.RESOLUTION_MAP.values(),
-    key=lambda r: (r[0] * r[1], max(r[0], r[1])),
-    reverse=True,
+CHUNK_SIZES = tuple(
+    sorted(
+        MetaFrameRes.RESOLUTION_MAP.values(),
+        key=lambda r: (r[0] * r[1], max(r[0], r[1])),
+        reverse=True,
+    )
 )
 
+# Set view of CHUNK_SIZES for membership tests, the tuple keeps the preferred order
+CHUNK_SIZES_SET = frozenset(CHUNK_SIZES)
+
 ORIENTATION_VALUES = {
     "original": (0, 0),
     "flip_h": (0, 1),
@@ -51,7 +58,9 @@ ORIENTATION_VALUES = {
 }
 
 # Reverse lookup: (v_flip, h_flip) -> orientation name
-ORIENTATION_FLAGS_TO_NAME = {v: k for k, v in ORIENTATION_VALUES.items()}
+ORIENTATION_FLAGS_TO_NAME = MappingProxyType(
+    {v: k for k, v in ORIENTATION_VALUES.items()}
+)
 
 
 PALETTE_SLOT_4BPP_BASE = 4
@@ -5,15 +5,22 @@ SIR0 is a container format used to wrap WAN files and other formats.
 This module contains functions for reading/parsing and writing/wrapping SIR0 containers.
 """
 
+import struct
 from typing import List, Tuple
+import numpy as np
 from data import (
     read_uint32,
-    write_uint32,
     align_offset,
-    pad_bytes,
 )
 from .constants import Sir0, PADDING_BYTE
 
+# Pointer offset lists shorter than this are decoded byte by byte
+VECTORIZED_DECODE_MIN_BYTES = 256
+
+# SIR0 header: big-endian magic, then little-endian subheader/offset list pointers and padding
+SIR0_MAGIC_STRUCT = struct.Struct(">I")
+SIR0_POINTERS_STRUCT = struct.Struct("<III")
+
 
 def read_sir0_header(data: bytes, offset: int = 0) -> Tuple[int, int, int, int]:
     """
@@ -36,57 +43,92 @@ def validate_sir0_header(
     return magic == Sir0.MAGIC and subheader_ptr > 0x10 and ptr_offset_list_ptr > 0x10
 
 
-def decode_pointer_offset_list(data: bytes, offset: int) -> List[int]:
-    """
-    Decode the SIR0 pointer offset list.
-
-    Implements the DecodeSIR0PtrOffsetList algorithm:
-    - Uses a buffer to accumulate bits
-    - Shifts buffer by 7 bits when continuation bit is set
-    - Accumulates offsetsum to get absolute offsets
-    """
+def _decode_pointer_offsets_loop(data: bytes, offset: int = 0) -> List[int]:
+    """Decode the pointer offset list byte by byte with arbitrary-size integers."""
     offsets = []
-    pos = offset
-
-    # SIR0 header pointers (0x04, 0x08) are encoded first in the list
+    append = offsets.append
     offset_sum = 0
     buffer = 0
     last_had_bit_flag = False
 
-    while pos < len(data) and (last_had_bit_flag or data[pos] != 0x00):
+    for pos in range(offset, len(data)):
         cur_byte = data[pos]
-        pos += 1
+        if cur_byte == 0 and not last_had_bit_flag:
+            break
 
         buffer |= cur_byte & 0x7F
-
-        if (0x80 & cur_byte) != 0:
+        if cur_byte & 0x80:
             last_had_bit_flag = True
             buffer <<= 7
         else:
             last_had_bit_flag = False
             offset_sum += buffer
-            offsets.append(offset_sum)
+            append(offset_sum)
             buffer = 0
 
     return offsets
 
 
-def extract_sir0_content(data: bytes) -> Tuple[bytes, List[int]]:
+def decode_pointer_offset_list(data: bytes, offset: int) -> List[int]:
+    """
+    Decode the SIR0 pointer offset list.
+
+    Implements the DecodeSIR0PtrOffsetList algorithm, vectorized with numpy:
+    - Each offset delta is a run of 7-bit groups, high bit set on all but the last
+    - The list ends at a zero byte that does not follow a continuation byte
+    - Deltas are accumulated (offsetsum) to get absolute offsets
+    """
+    # numpy setup costs more than the byte loop on short lists
+    if len(data) - offset < VECTORIZED_DECODE_MIN_BYTES:
+        return _decode_pointer_offsets_loop(data, offset)
+
+    # SIR0 header pointers (0x04, 0x08) are encoded first in the list
+    arr = np.frombuffer(data, dtype=np.uint8, offset=offset)
+    is_continuation = (arr & 0x80) != 0
+
+    follows_continuation = np.zeros_like(is_continuation)
+    follows_continuation[1:] = is_continuation[:-1]
+    terminators = np.flatnonzero((arr == 0) & ~follows_continuation)
+    if terminators.size:
+        arr = arr[: terminators[0]]
+        is_continuation = is_continuation[: terminators[0]]
+
+    # A trailing delta without its final byte is never added
+    ends = np.flatnonzero(~is_continuation)
+    if not ends.size:
+        return []
+    arr = arr[: ends[-1] + 1]
+
+    # Deltas over 9 bytes (63 bits) do not fit uint64, decode those in Python
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    if (ends - starts).max() >= 9:
+        return _decode_pointer_offsets_loop(arr.tobytes())
+
+    # Shift every 7-bit group by its distance from the end of its delta
+    positions = np.arange(arr.size)
+    shifts = 7 * (ends[np.searchsorted(ends, positions)] - positions)
+    groups = (arr & 0x7F).astype(np.uint64) << shifts.astype(np.uint64)
+    deltas = np.add.reduceat(groups, starts)
+
+    return np.cumsum(deltas).tolist()
+
+
+def extract_sir0_content(data: bytes) -> Tuple[memoryview, List[int]]:
     """
     Extract the actual content from an SIR0 container.
 
+    The content is a zero-copy view into data, call bytes() on it if a copy is needed.
+
     Returns:
-        Tuple of (content_bytes, pointer_offsets)
+        Tuple of (content_view, pointer_offsets)
     """
     magic, subheader_ptr, ptr_offset_list_ptr, padding = read_sir0_header(data)
 
     if not validate_sir0_header(magic, subheader_ptr, ptr_offset_list_ptr):
         raise ValueError("Invalid SIR0 header")
 
-    content = data[:ptr_offset_list_ptr]
-
-    ptr_list_data = data[ptr_offset_list_ptr:]
-    offsets = decode_pointer_offset_list(ptr_list_data, 0)
+    content = memoryview(data)[:ptr_offset_list_ptr]
+    offsets = decode_pointer_offset_list(data, ptr_offset_list_ptr)
 
     return content, offsets
 
@@ -102,12 +144,9 @@ def write_sir0_header(subheader_ptr: int, ptr_offset_list_ptr: int) -> bytes:
     Returns:
         SIR0 header as bytes (16 bytes)
     """
-    result = bytearray()
-    result.extend(write_uint32(Sir0.MAGIC, little_endian=False))
-    result.extend(write_uint32(subheader_ptr))
-    result.extend(write_uint32(ptr_offset_list_ptr))
-    result.extend(write_uint32(0))
-    return bytes(result)
+    return SIR0_MAGIC_STRUCT.pack(Sir0.MAGIC) + SIR0_POINTERS_STRUCT.pack(
+        subheader_ptr, ptr_offset_list_ptr, 0
+    )
 
 
 def encode_pointer_offset_list(offsets: List[int]) -> bytes:
@@ -143,19 +182,24 @@ def encode_pointer_offset_list(offsets: List[int]) -> bytes:
 
     offset_so_far = 0
 
+    append = result.append
+
     for anoffset in offsets_to_encode:
-        offset_to_encode = anoffset - offset_so_far
+        # At most 4 groups of 7 bits are encoded, higher bits are dropped
+        offset_to_encode = (anoffset - offset_so_far) & 0x0FFFFFFF
         offset_so_far = anoffset
-        has_higher_non_zero = False
-
-        for i in range(4, 0, -1):
-            current_byte = (offset_to_encode >> (7 * (i - 1))) & 0x7F
 
-            if i == 1:
-                result.append(current_byte)
-            elif current_byte != 0 or has_higher_non_zero:
-                result.append(current_byte | 0x80)
-                has_higher_non_zero = True
+        # Leading zero groups are skipped, the last group is always written
+        # Most deltas fit in one or two groups, so those skip the group loop
+        if offset_to_encode < 0x80:
+            append(offset_to_encode)
+        elif offset_to_encode < 0x4000:
+            append((offset_to_encode >> 7) | 0x80)
+            append(offset_to_encode & 0x7F)
+        else:
+            for i in range((offset_to_encode.bit_length() + 6) // 7, 1, -1):
+                append(((offset_to_encode >> (7 * (i - 1))) & 0x7F) | 0x80)
+            append(offset_to_encode & 0x7F)
 
     result.append(0x00)
     return bytes(result)
@@ -175,35 +219,22 @@ def wrap_sir0(
     Returns:
         Complete SIR0 file as bytes
     """
-
-    result = bytearray()
-
-    header_pos = 0
-    result.extend(bytes(Sir0.HEADER_LEN))
-
-    content_start = len(result)
-    result.extend(content)
-
-    content_end = len(result)
-    aligned_end = align_offset(content_end, 16)
-    padding_needed = aligned_end - content_end
-    if padding_needed > 0:
-        result.extend(pad_bytes(padding_needed, PADDING_BYTE))
-
-    ptr_list_start = len(result)
     encoded_offsets = encode_pointer_offset_list(pointer_offsets)
-    result.extend(encoded_offsets)
 
-    final_pos = len(result)
-    aligned_pos = align_offset(final_pos, 16)
-    padding_needed = aligned_pos - final_pos
-    if padding_needed > 0:
-        result.extend(pad_bytes(padding_needed, PADDING_BYTE))
+    # Final layout is known up front: header, content, padding, offsets, padding
+    content_start = Sir0.HEADER_LEN
+    content_end = content_start + len(content)
+    ptr_list_start = align_offset(content_end, 16)
+    ptr_list_end = ptr_list_start + len(encoded_offsets)
+    total_len = align_offset(ptr_list_end, 16)
 
-    header_bytes = write_sir0_header(
+    # Preallocate the file filled with padding, then write each part in place
+    result = bytearray((PADDING_BYTE,)) * total_len
+    result[:content_start] = write_sir0_header(
         subheader_ptr=content_start + subheader_offset,
         ptr_offset_list_ptr=ptr_list_start,
     )
-    result[header_pos : header_pos + Sir0.HEADER_LEN] = header_bytes
+    result[content_start:content_end] = content
+    result[ptr_list_start:ptr_list_end] = encoded_offsets
 
     return bytes(result)
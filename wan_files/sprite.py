@@ -2,33 +2,44 @@
 Sprite data structures and constants for representing WAN sprite data.
 """
 
+import sys
+import weakref
 import numpy as np
 from typing import List, Tuple
 from dataclasses import dataclass, field
-from data import enum_res_to_integer, DEBUG
+from data import DEBUG
 
 from .constants import (
     WanFormat,
     MetaFrameRes,
     CHUNK_SIZES,
+    CHUNK_SIZES_SET,
     PALETTE_SLOT_4BPP_BASE,
     PALETTE_SLOT_8BPP_BASE,
     PALETTE_OFFSET_BASE,
     PALETTE_SLOT_COLOR_COUNT,
 )
 
+# Resolution enum -> (width, height), unknown values map to 64x64 like enum_res_to_integer
+_RES_TO_WH = np.full((256, 2), 64, dtype=np.int64)
+for _res, _wh in MetaFrameRes.RESOLUTION_MAP.items():
+    _RES_TO_WH[_res] = _wh
+_RES_TO_WH.setflags(write=False)
+del _res, _wh
 
-def _allocated_tiles(width: int, height: int, is_8bpp: bool = False) -> int:
+# Slotted records skip the per-instance __dict__ (dataclass slots needs Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _allocated_tiles(width: int, height: int, shift: int) -> int:
     """Calculate memory blocks allocated for a chunk.
 
-    4bpp: 256 pixels per block, 8bpp: 128 pixels per block.
+    Blocks hold 1 << shift pixels: 4bpp uses 8 (256 pixels), 8bpp uses 7 (128 pixels).
     """
-    pixels = width * height
-    block_size = 128 if is_8bpp else 256
-    return (pixels + block_size - 1) // block_size
+    return (width * height + (1 << shift) - 1) >> shift
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SprOffParticle:
     """Particle offset entry."""
 
@@ -36,14 +47,14 @@ class SprOffParticle:
     offy: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ImageInfo:
     """Image-specific information."""
 
     zindex: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MetaFrame:
     """Meta-frame structure containing frame properties."""
 
@@ -65,14 +76,14 @@ class MetaFrame:
     anim_refs: List[Tuple[int, int]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MetaFrameGroup:
     """Group of meta-frame indices."""
 
     metaframes: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AnimFrame:
     """Single animation frame."""
 
@@ -85,16 +96,30 @@ class AnimFrame:
 
     def is_null(self) -> bool:
         """Check if this is a null frame."""
-        return (
-            self.frame_duration == 0
-            and self.meta_frm_grp_index == 0
-            and self.spr_offset_x == 0
-            and self.spr_offset_y == 0
-            and self.shadow_offset_x == 0
-            and self.shadow_offset_y == 0
+        # Truth tests short-circuit on the first non-zero field of a regular frame
+        return not (
+            self.frame_duration
+            or self.meta_frm_grp_index
+            or self.spr_offset_x
+            or self.spr_offset_y
+            or self.shadow_offset_x
+            or self.shadow_offset_y
         )
 
 
+# On-disk layout of an animation frame (WanFormat.LENGTH_ANIM_FRM bytes)
+ANIMFRAME_DTYPE = np.dtype(
+    [
+        ("frame_duration", "<u2"),
+        ("meta_frm_grp_index", "<u2"),
+        ("spr_offset_x", "<i2"),
+        ("spr_offset_y", "<i2"),
+        ("shadow_offset_x", "<i2"),
+        ("shadow_offset_y", "<i2"),
+    ]
+)
+
+
 class AnimationSequence:
     """Animation sequence containing multiple frames."""
 
@@ -112,19 +137,51 @@ class AnimationSequence:
             self.frames.insert(index, frame)
             return index
 
+    def to_records(self) -> np.ndarray:
+        """Return the frames as an ANIMFRAME_DTYPE array, ready to serialize."""
+        return np.array(
+            [
+                (
+                    af.frame_duration,
+                    af.meta_frm_grp_index,
+                    af.spr_offset_x,
+                    af.spr_offset_y,
+                    af.shadow_offset_x,
+                    af.shadow_offset_y,
+                )
+                for af in self.frames
+            ],
+            dtype=ANIMFRAME_DTYPE,
+        )
+
     def remove_frame(self, index: int) -> None:
-        """Remove frame at index."""
+        """Remove frame at index, keeping the playback order of later frames."""
         del self.frames[index]
 
+    def remove_frames(self, indexes) -> None:
+        """Remove the frames at several indexes in one pass, keeping playback order.
+
+        Negative indexes count from the end like remove_frame. An index listed
+        more than once removes its frame once. Every index is checked before any
+        frame is removed, out-of-range ones raise IndexError.
+        """
+        nbframes = len(self.frames)
+        to_remove = set()
+        for index in indexes:
+            if not -nbframes <= index < nbframes:
+                raise IndexError("frame index out of range")
+            to_remove.add(index % nbframes)
+        self.frames = [f for i, f in enumerate(self.frames) if i not in to_remove]
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SpriteAnimationGroup:
     """Group of animation sequences."""
 
     seqs_indexes: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SprInfo:
     """Common sprite information."""
 
@@ -144,6 +201,11 @@ class SprInfo:
     tiles_mode: int = 0  # 1 for tile-based assembly, 0 for chunk-based
 
 
+# Shared read-only placeholder, readers assign a new array instead of filling it
+_EMPTY_PIXELS = np.empty((0, 0), dtype=np.uint8)
+_EMPTY_PIXELS.setflags(write=False)
+
+
 class TiledImage:
     """Base class for tiled images.
 
@@ -156,7 +218,27 @@ class TiledImage:
 
     def __init__(self):
         """Initialize with empty pixels array. Will be populated when reading from WAN or importing from PNG."""
-        self.pixels: np.ndarray = np.array([], dtype=np.uint8).reshape(0, 0)
+        self.pixels: np.ndarray = _EMPTY_PIXELS
+
+
+# Palettes loaded from files, shared by sprites with identical colors while any uses them
+_PALETTE_INTERN = weakref.WeakValueDictionary()
+
+
+def intern_palette(palette: np.ndarray) -> np.ndarray:
+    """Return a shared read-only array with the same colors as palette.
+
+    Palettes are never modified in place, so sprites from the same family can
+    share one array instead of each holding a copy. The caller's array is left
+    writable, only the private copy kept here is frozen.
+    """
+    key = (palette.dtype.str, palette.shape, palette.tobytes())
+    shared = _PALETTE_INTERN.get(key)
+    if shared is None:
+        shared = palette.copy()
+        shared.setflags(write=False)
+        _PALETTE_INTERN[key] = shared
+    return shared
 
 
 class BaseSprite:
@@ -198,6 +280,11 @@ class BaseSprite:
         palette_color_count = self.palette.size // 3
         max_colors_used = self.spr_info.max_colors_used
         palette_slots_used = self.spr_info.palette_slots_used
+        palette_slot_base = (
+            PALETTE_SLOT_8BPP_BASE if is_8bpp else PALETTE_SLOT_4BPP_BASE
+        )
+        # log2 of the pixels per memory block
+        shift = 7 if is_8bpp else 8
 
         num_frames = len(self.frames)
         num_metaframes = len(self.metaframes)
@@ -264,45 +351,63 @@ class BaseSprite:
         has_special_metaframe = False
         has_normal_metaframe = False
 
+        # Module globals bound to locals for the per-frame loops below
+        chunk_sizes = CHUNK_SIZES_SET
+        allocated_tiles = _allocated_tiles
+        special_id = WanFormat.SPECIAL_META_FRAME_ID
+
         for frame_idx, frame in enumerate(self.frames):
-            if frame.pixels.size > 0:
-                height, width = frame.pixels.shape
-                dimensions = (width, height)
-                if dimensions not in CHUNK_SIZES:
+            pixels = frame.pixels
+            if pixels.size > 0:
+                height, width = pixels.shape
+                if (width, height) not in chunk_sizes:
                     errors.append(
                         f"Frame[{frame_idx}]: Invalid dimensions {width}x{height}, "
-                        f"must match one of: {CHUNK_SIZES}"
+                        f"must match one of: {list(CHUNK_SIZES)}"
                     )
-                total_available_tiles += _allocated_tiles(width, height, is_8bpp)
+                total_available_tiles += allocated_tiles(width, height, shift)
 
         max_tiles_required = 0
         max_memory_used = 0
-        for mf_idx, mf in enumerate(self.metaframes):
-            width, height = enum_res_to_integer(mf.resolution)
-            memory_blocks = _allocated_tiles(width, height, is_8bpp)
-
-            if mf.image_index == WanFormat.SPECIAL_META_FRAME_ID:
-                has_special_metaframe = True
-                chunk_memory_offset = mf.memory_offset
-
-                tiles_required = chunk_memory_offset + memory_blocks
-                if tiles_required > max_tiles_required:
-                    max_tiles_required = tiles_required
-            else:
-                has_normal_metaframe = True
-                if (
-                    mf.image_index < 0
-                    or mf.image_index >= num_frames
-                    and not is_animation_base
-                ):
-                    errors.append(
-                        f"MetaFrame[{mf_idx}]: Invalid image_index {mf.image_index}, "
-                        f"must be {WanFormat.SPECIAL_META_FRAME_ID} (special) or in range [0, {num_frames - 1}]"
-                    )
-
-            memory_usage = mf.memory_offset + memory_blocks
-            if memory_usage > max_memory_used:
-                max_memory_used = memory_usage
+        if num_metaframes > 0:
+            # Compute memory blocks for all metaframes in one pass
+            metaframes = self.metaframes
+            res = np.fromiter(
+                (mf.resolution for mf in metaframes),
+                dtype=np.int64,
+                count=num_metaframes,
+            )
+            memory_offsets = np.fromiter(
+                (mf.memory_offset for mf in metaframes),
+                dtype=np.int64,
+                count=num_metaframes,
+            )
+            image_indexes = np.fromiter(
+                (mf.image_index for mf in metaframes),
+                dtype=np.int64,
+                count=num_metaframes,
+            )
+            res[(res < 0) | (res >= len(_RES_TO_WH))] = MetaFrameRes._INVALID
+            wh = _RES_TO_WH[res]
+            memory_blocks = (wh[:, 0] * wh[:, 1] + ((1 << shift) - 1)) >> shift
+            memory_usage = memory_offsets + memory_blocks
+            max_memory_used = max(int(memory_usage.max()), 0)
+
+            is_special = image_indexes == special_id
+            has_special_metaframe = bool(is_special.any())
+            has_normal_metaframe = not is_special.all()
+            if has_special_metaframe:
+                max_tiles_required = max(int(memory_usage[is_special].max()), 0)
+
+            invalid_image_index = image_indexes < 0
+            if not is_animation_base:
+                invalid_image_index |= image_indexes >= num_frames
+            invalid_image_index &= ~is_special
+            for mf_idx in np.flatnonzero(invalid_image_index).tolist():
+                errors.append(
+                    f"MetaFrame[{mf_idx}]: Invalid image_index {metaframes[mf_idx].image_index}, "
+                    f"must be {special_id} (special) or in range [0, {num_frames - 1}]"
+                )
 
         is_tiles_mode = has_special_metaframe and not has_normal_metaframe
 
@@ -323,32 +428,66 @@ class BaseSprite:
                     f"(deficit: {max_tiles_required - total_available_tiles} tiles)"
                 )
 
-        for group_idx, group in enumerate(self.metaframe_groups):
-            for mf_ref_idx, mf_ref in enumerate(group.metaframes):
-                if mf_ref < 0 or mf_ref >= num_metaframes:
-                    errors.append(
-                        f"MetaFrameGroup[{group_idx}].metaframes[{mf_ref_idx}]: "
-                        f"Invalid metaframe index {mf_ref}, must be in range [0, {num_metaframes - 1}]"
-                    )
-
-        for seq_idx, seq in enumerate(self.anim_sequences):
-            for frame_idx, af in enumerate(seq.frames):
-                # In tiles mode, meta_frm_grp_index >= num_metaframe_groups indicates
-                # a blank frame, not an error. Only validate for non-tiles-mode sprites.
-                if af.meta_frm_grp_index < 0:
-                    errors.append(
-                        f"AnimationSequence[{seq_idx}] AnimFrame[{frame_idx}]: "
-                        f"Invalid meta_frm_grp_index {af.meta_frm_grp_index}, "
-                        f"must be >= 0"
-                    )
-                elif (
-                    not is_tiles_mode and af.meta_frm_grp_index >= num_metaframe_groups
-                ):
-                    errors.append(
-                        f"AnimationSequence[{seq_idx}] AnimFrame[{frame_idx}]: "
-                        f"Invalid meta_frm_grp_index {af.meta_frm_grp_index}, "
-                        f"must be in range [0, {num_metaframe_groups - 1}]"
-                    )
+        # Range-check all metaframe references at once, only walk the groups
+        # to report the offending entries when something is out of range
+        num_mf_refs = sum(len(group.metaframes) for group in self.metaframe_groups)
+        if num_mf_refs > 0:
+            mf_refs = np.fromiter(
+                (
+                    mf_ref
+                    for group in self.metaframe_groups
+                    for mf_ref in group.metaframes
+                ),
+                dtype=np.int64,
+                count=num_mf_refs,
+            )
+            if mf_refs.min() < 0 or mf_refs.max() >= num_metaframes:
+                for group_idx, group in enumerate(self.metaframe_groups):
+                    for mf_ref_idx, mf_ref in enumerate(group.metaframes):
+                        if mf_ref < 0 or mf_ref >= num_metaframes:
+                            errors.append(
+                                f"MetaFrameGroup[{group_idx}].metaframes[{mf_ref_idx}]: "
+                                f"Invalid metaframe index {mf_ref}, must be in range [0, {num_metaframes - 1}]"
+                            )
+
+        # Check the group index of every animation frame in one pass
+        seq_lengths = [len(seq.frames) for seq in self.anim_sequences]
+        num_anim_frames = sum(seq_lengths)
+        if num_anim_frames > 0:
+            grp_indexes = np.fromiter(
+                (
+                    af.meta_frm_grp_index
+                    for seq in self.anim_sequences
+                    for af in seq.frames
+                ),
+                dtype=np.int64,
+                count=num_anim_frames,
+            )
+            invalid_grp_index = grp_indexes < 0
+            # In tiles mode, meta_frm_grp_index >= num_metaframe_groups indicates
+            # a blank frame, not an error. Only validate for non-tiles-mode sprites.
+            if not is_tiles_mode:
+                invalid_grp_index |= grp_indexes >= num_metaframe_groups
+
+            if invalid_grp_index.any():
+                seq_starts = np.cumsum([0] + seq_lengths[:-1])
+                for flat_idx in np.flatnonzero(invalid_grp_index).tolist():
+                    seq_idx = int(np.searchsorted(seq_starts, flat_idx, "right")) - 1
+                    frame_idx = flat_idx - int(seq_starts[seq_idx])
+                    af = self.anim_sequences[seq_idx].frames[frame_idx]
+                    grp_index = af.meta_frm_grp_index
+                    if grp_index < 0:
+                        errors.append(
+                            f"AnimationSequence[{seq_idx}] AnimFrame[{frame_idx}]: "
+                            f"Invalid meta_frm_grp_index {grp_index}, "
+                            f"must be >= 0"
+                        )
+                    else:
+                        errors.append(
+                            f"AnimationSequence[{seq_idx}] AnimFrame[{frame_idx}]: "
+                            f"Invalid meta_frm_grp_index {grp_index}, "
+                            f"must be in range [0, {num_metaframe_groups - 1}]"
+                        )
 
         if max_colors_used > palette_color_count:
             errors.append(
@@ -357,9 +496,6 @@ class BaseSprite:
             )
 
         # Validate color limits based on sprite type
-        palette_slot_base = (
-            PALETTE_SLOT_8BPP_BASE if is_8bpp else PALETTE_SLOT_4BPP_BASE
-        )
         is_base_sprite = is_4bpp_base or is_image_base
 
         if is_base_sprite:
@@ -413,18 +549,27 @@ class BaseSprite:
         )
 
         # For normal sprites, check if any metaframe uses base palette slots
-        if requires_base_sprite is None and not is_4bpp_base:
-            palette_slot_base = (
-                PALETTE_SLOT_8BPP_BASE if is_8bpp else PALETTE_SLOT_4BPP_BASE
+        if requires_base_sprite is None and not is_4bpp_base and num_metaframes > 0:
+            palette_offsets = np.fromiter(
+                (mf.palette_offset for mf in self.metaframes),
+                dtype=np.int64,
+                count=num_metaframes,
             )
-            for mf in self.metaframes:
-                if is_8bpp or mf.is_absolute_palette == 1:
-                    palette_slot = (
-                        mf.palette_offset - PALETTE_OFFSET_BASE
-                    ) // PALETTE_SLOT_COLOR_COUNT
-                    if palette_slot < palette_slot_base:
-                        requires_base_sprite = "image" if is_8bpp else "4bpp"
-                        break
+            palette_slots = (
+                palette_offsets - PALETTE_OFFSET_BASE
+            ) // PALETTE_SLOT_COLOR_COUNT
+            uses_base_slot = palette_slots < palette_slot_base
+            if not is_8bpp:
+                uses_base_slot &= (
+                    np.fromiter(
+                        (mf.is_absolute_palette for mf in self.metaframes),
+                        dtype=np.int64,
+                        count=num_metaframes,
+                    )
+                    == 1
+                )
+            if uses_base_slot.any():
+                requires_base_sprite = "image" if is_8bpp else "4bpp"
 
         # Determine base_type: "image", "animation", "4bpp", or None
         base_type = (
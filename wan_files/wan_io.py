@@ -6,12 +6,21 @@ from pathlib import Path
 from typing import Union, Optional
 
 from .sprite import BaseSprite
-from data import read_file_to_bytes, write_bytes_to_file
+from data import write_bytes_to_file
 from external_files import read_external_files, write_external_files
 from .wan_parser import WANParser
 from .wan_writer import WANWriter
 
 
+def _parse_wan(parser: WANParser) -> BaseSprite:
+    """Parse a WAN sprite, detecting 4bpp/8bpp from the image data header."""
+    parser._read_headers()
+
+    is_4bpp = not (parser.wan_img_data_info and parser.wan_img_data_info.is_8bpp_sprite)
+
+    return parser.parse(is_4bpp=is_4bpp)
+
+
 def extract_wan(
     wan_input: Union[Path, bytes], output_dir: Optional[Path] = None
 ) -> BaseSprite:
@@ -26,16 +35,13 @@ def extract_wan(
         BaseSprite object
     """
     if isinstance(wan_input, bytes):
-        rawdata = wan_input
+        parser = WANParser(wan_input)
     else:
-        rawdata = read_file_to_bytes(wan_input)
-
-    parser = WANParser(rawdata)
-    parser._read_headers()
-
-    is_4bpp = not (parser.wan_img_data_info and parser.wan_img_data_info.is_8bpp_sprite)
+        parser = WANParser.from_path(wan_input)
 
-    sprite = parser.parse(is_4bpp=is_4bpp)
+    sprite = _parse_wan(parser)
+    # Release the parser, and with it any file map, before writing output
+    del parser
 
     if output_dir is not None:
         write_external_files(sprite, output_dir)
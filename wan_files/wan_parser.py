@@ -2,6 +2,10 @@
 WAN file parser for reading .wan sprite files.
 """
 
+import os
+import mmap
+import struct
+from pathlib import Path
 from typing import List, Optional, Tuple
 import numpy as np
 
@@ -16,18 +20,24 @@ from .sprite import (
     SprOffParticle,
     ImageInfo,
     TiledImage,
+    intern_palette,
 )
-from .constants import WanFormat
+from .constants import WanFormat, MetaFrameRes
 from data import (
     read_uint32,
-    read_uint16,
-    read_uint8,
-    read_int16,
-    enum_res_to_integer,
     TILE_SIZE,
     TILE_AREA,
 )
 
+# Fixed-size on-disk records, each read with a single unpack_from
+_SUBHEADER_STRUCT = struct.Struct("<IIHH")
+_ANIM_INFO_STRUCT = struct.Struct("<IIIHHHHHH")
+_IMG_DATA_INFO_STRUCT = struct.Struct("<IIHHHH")
+_PAL_INFO_STRUCT = struct.Struct("<IHHHHI")
+_ASM_ENTRY_STRUCT = struct.Struct("<IHHI")
+_META_FRAME_STRUCT = struct.Struct("<hHHHBB")
+_ANIM_FRAME_STRUCT = struct.Struct("<HHhhhh")
+
 
 class WANSubHeader:
     """WAN sub-header structure."""
@@ -42,10 +52,12 @@ class WANSubHeader:
     def read_from_bytes(cls, data: bytes, offset: int) -> "WANSubHeader":
         """Read WAN sub-header from bytes."""
         header = cls()
-        header.ptr_animinfo = read_uint32(data, offset)
-        header.ptr_imginfo = read_uint32(data, offset + 4)
-        header.sprite_type = read_uint16(data, offset + 8)
-        header.const0_unk12 = read_uint16(data, offset + 10)
+        (
+            header.ptr_animinfo,
+            header.ptr_imginfo,
+            header.sprite_type,
+            header.const0_unk12,
+        ) = _SUBHEADER_STRUCT.unpack_from(data, offset)
         return header
 
 
@@ -67,15 +79,17 @@ class WANAnimInfo:
     def read_from_bytes(cls, data: bytes, offset: int) -> "WANAnimInfo":
         """Read animation info from bytes."""
         info = cls()
-        info.ptr_meta_frm_table = read_uint32(data, offset)
-        info.ptr_p_offsets_table = read_uint32(data, offset + 4)
-        info.ptr_anim_grp_table = read_uint32(data, offset + 8)
-        info.nb_anim_groups = read_uint16(data, offset + 12)
-        info.max_memory_used = read_uint16(data, offset + 14)
-        info.const0_unk7 = read_uint16(data, offset + 16)
-        info.const0_unk8 = read_uint16(data, offset + 18)
-        info.bool_unk9 = read_uint16(data, offset + 20)
-        info.const0_unk10 = read_uint16(data, offset + 22)
+        (
+            info.ptr_meta_frm_table,
+            info.ptr_p_offsets_table,
+            info.ptr_anim_grp_table,
+            info.nb_anim_groups,
+            info.max_memory_used,
+            info.const0_unk7,
+            info.const0_unk8,
+            info.bool_unk9,
+            info.const0_unk10,
+        ) = _ANIM_INFO_STRUCT.unpack_from(data, offset)
         return info
 
 
@@ -94,12 +108,14 @@ class WANImgDataInfo:
     def read_from_bytes(cls, data: bytes, offset: int) -> "WANImgDataInfo":
         """Read image data info from bytes."""
         info = cls()
-        info.ptr_imgs_tbl = read_uint32(data, offset)
-        info.ptr_pal = read_uint32(data, offset + 4)
-        info.tiles_mode = read_uint16(data, offset + 8)
-        info.is_8bpp_sprite = read_uint16(data, offset + 10)
-        info.palette_slots_used = read_uint16(data, offset + 12)
-        info.nb_imgs_tbl_ptr = read_uint16(data, offset + 14)
+        (
+            info.ptr_imgs_tbl,
+            info.ptr_pal,
+            info.tiles_mode,
+            info.is_8bpp_sprite,
+            info.palette_slots_used,
+            info.nb_imgs_tbl_ptr,
+        ) = _IMG_DATA_INFO_STRUCT.unpack_from(data, offset)
         return info
 
 
@@ -118,52 +134,75 @@ class WANPalInfo:
     def read_from_bytes(cls, data: bytes, offset: int) -> "WANPalInfo":
         """Read palette info from bytes."""
         info = cls()
-        info.ptr_pal = read_uint32(data, offset)
-        info.bool_unk3 = read_uint16(data, offset + 4)
-        info.max_colors_used = read_uint16(data, offset + 6)
-        info.unk4 = read_uint16(data, offset + 8)
-        info.unk5 = read_uint16(data, offset + 10)
-        info.null_bytes = read_uint32(data, offset + 12)
+        (
+            info.ptr_pal,
+            info.bool_unk3,
+            info.max_colors_used,
+            info.unk4,
+            info.unk5,
+            info.null_bytes,
+        ) = _PAL_INFO_STRUCT.unpack_from(data, offset)
         return info
 
 
-class ImgAsmTblEntry:
-    """Image assembly table entry."""
+# 4bpp byte -> (low nybble, high nybble), WAN stores the low nybble pixel first
+_NIBBLE_LUT = np.empty((256, 2), dtype=np.uint8)
+_NIBBLE_LUT[:, 0] = np.arange(256) & 0x0F
+_NIBBLE_LUT[:, 1] = np.arange(256) >> 4
+_NIBBLE_LUT.flags.writeable = False
 
-    def __init__(self):
-        self.pixelsrc = 0
-        self.pixamt = 0
-        self.unk14 = 0
-        self.z_index = 0
+# Particle offset table entry
+_PART_OFFSET_DTYPE = np.dtype([("offx", "<i2"), ("offy", "<i2")])
 
-    @classmethod
-    def read_from_bytes(cls, data: bytes, offset: int) -> "ImgAsmTblEntry":
-        """Read assembly table entry from bytes."""
-        entry = cls()
-        entry.pixelsrc = read_uint32(data, offset)
-        entry.pixamt = read_uint16(data, offset + 4)
-        entry.unk14 = read_uint16(data, offset + 6)
-        entry.z_index = read_uint32(data, offset + 8)
-        return entry
 
-    def is_null(self) -> bool:
-        """Check if this is a null entry."""
-        return self.pixelsrc == 0 and self.pixamt == 0 and self.z_index == 0
+# Resolution enum -> (width, height) for every decodable enum byte, unknown values
+# map to 64x64 like enum_res_to_integer
+_RES_DIMENSIONS = tuple(
+    MetaFrameRes.RESOLUTION_MAP.get(res, (64, 64)) for res in range(256)
+)
+
+
+def _fallback_tile_arrangement(num_tiles: int) -> Tuple[int, int]:
+    """Pick the most square power-of-two tile grid for a frame without known dimensions."""
+    if num_tiles == 0:
+        return (1, 1)
+    elif num_tiles == 1:
+        return (1, 1)
+    elif num_tiles == 4:
+        return (2, 2)
+    elif num_tiles == 8:
+        return (4, 2)  # Prefer landscape (4x2) over portrait (2x4)
+    elif num_tiles == 16:
+        return (4, 4)
+    else:
+        best_arrangement = None
+        best_score = float("inf")
+
+        for tiles_x in [1, 2, 4, 8, 16, 32]:
+            if num_tiles % tiles_x == 0:
+                tiles_y = num_tiles // tiles_x
+                aspect_ratio = max(tiles_x, tiles_y) / min(tiles_x, tiles_y)
 
+                if aspect_ratio < best_score:
+                    best_score = aspect_ratio
+                    best_arrangement = (tiles_x, tiles_y)
 
-def _get_resolution_from_offsets(xoffset: int, yoffset: int) -> int:
-    """Extract resolution enum from offset values (first 2 bits of each)."""
-    y_bits = (yoffset & 0xC000) >> 8
-    x_bits = (xoffset & 0xC000) >> 12
-    return y_bits | x_bits
+        result = best_arrangement if best_arrangement else (4, (num_tiles + 3) // 4)
+        return result
+
+
+# Tile counts seen in practice are small, precompute their arrangements
+_TILE_ARRANGEMENTS = {n: _fallback_tile_arrangement(n) for n in range(1025)}
 
 
 class WANParser:
     """Parser for WAN sprite files."""
 
     def __init__(self, rawdata: bytes):
-        """Initialize parser with raw WAN file data."""
+        """Initialize parser with raw WAN file data (bytes or any read-only buffer)."""
         self.rawdata = rawdata
+        # Slicing the view instead of rawdata lets np.frombuffer read in place
+        self._mv = memoryview(rawdata)
         self.sir0_header: Optional[Tuple[int, int, int, int]] = (
             None  # (magic, subheader_ptr, ptr_offset_list_ptr, padding)
         )
@@ -172,6 +211,20 @@ class WANParser:
         self.wan_img_data_info: Optional[WANImgDataInfo] = None
         self.wan_pal_info: Optional[WANPalInfo] = None
 
+    @classmethod
+    def from_path(cls, path: Path) -> "WANParser":
+        """Create a parser over a read-only memory map of a WAN file.
+
+        Pages are read on demand instead of copying the file up front. The map
+        is released with the parser and its views, not closed explicitly, since
+        closing fails while a traceback still holds a view.
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files can't be mapped, let the header read reject them
+                return cls(b"")
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
     def parse(self, is_4bpp: bool) -> BaseSprite:
         """Parse sprite as 4bpp or 8bpp.
 
@@ -183,6 +236,12 @@ class WANParser:
         self._read_images(sprite, is_4bpp=is_4bpp)
         return sprite
 
+    def _read_uint32_list(self, offset: int, count: int) -> List[int]:
+        """Read a table of count little-endian uint32 values in one call."""
+        if count <= 0:
+            return []
+        return np.frombuffer(self._mv, dtype="<u4", count=count, offset=offset).tolist()
+
     def _read_headers(self) -> None:
         """Read all headers."""
         if self.sir0_header is not None:
@@ -213,7 +272,7 @@ class WANParser:
         """Parse common sprite data."""
         self._read_headers()
 
-        sprite.palette = self._read_palette()
+        sprite.palette = intern_palette(self._read_palette())
 
         if self.wan_img_data_info:
             sprite.spr_info.is_8bpp_sprite = self.wan_img_data_info.is_8bpp_sprite
@@ -262,12 +321,11 @@ class WANParser:
         nb_colors = (palette_end - palette_start) // 4
 
         if nb_colors > 0:
-            palette_bytes = self.rawdata[palette_start : palette_start + nb_colors * 4]
-            palette_arr = np.frombuffer(palette_bytes, dtype=np.uint8).reshape(
-                nb_colors, 4
-            )
+            palette_arr = np.frombuffer(
+                self._mv[palette_start : palette_start + nb_colors * 4], dtype=np.uint8
+            ).reshape(nb_colors, 4)
 
-            palette = palette_arr[:, :3].flatten()
+            palette = np.ascontiguousarray(palette_arr[:, :3]).reshape(-1)
         else:
             palette = np.array([], dtype=np.uint8)
 
@@ -289,48 +347,62 @@ class WANParser:
             end_mf_ptr_tbl - self.wan_anim_info.ptr_meta_frm_table
         ) // 4
 
-        if nb_ptr_mf_grp_tbl == 0:
+        if nb_ptr_mf_grp_tbl <= 0:
             return [], []
 
-        pos = self.wan_anim_info.ptr_meta_frm_table
-        mf_ptr_tbl = [
-            read_uint32(self.rawdata, pos + i * 4) for i in range(nb_ptr_mf_grp_tbl)
-        ]
+        mf_ptr_tbl = self._read_uint32_list(
+            self.wan_anim_info.ptr_meta_frm_table, nb_ptr_mf_grp_tbl
+        )
 
         metaframes = []
         metaframe_groups = []
 
+        data_len = len(self._mv)
+        record_len = _META_FRAME_STRUCT.size
+
         for grp_ptr in mf_ptr_tbl:
             group = MetaFrameGroup()
-            pos = grp_ptr
+            # Records run until the last-frame flag, bounded by the end of the data
+            nb_records = max(data_len - grp_ptr, 0) // record_len
+            records = self._mv[grp_ptr : grp_ptr + nb_records * record_len]
 
-            while pos < len(self.rawdata):
-                mf, is_last = self._read_meta_frame(pos)
+            for fields in _META_FRAME_STRUCT.iter_unpack(records):
+                mf, is_last = self._decode_meta_frame(*fields)
                 metaframes.append(mf)
                 group.metaframes.append(len(metaframes) - 1)
-                pos += WanFormat.LENGTH_META_FRM
                 if is_last:
                     break
+            else:
+                tail = grp_ptr + nb_records * record_len
+                if tail < data_len:
+                    raise struct.error(f"Truncated meta-frame at offset {tail:#x}")
 
             metaframe_groups.append(group)
 
         return metaframes, metaframe_groups
 
-    def _read_meta_frame(self, offset: int) -> Tuple[MetaFrame, bool]:
-        """Read a single meta-frame from WAN container. Returns (MetaFrame, is_last)."""
+    def _decode_meta_frame(
+        self,
+        image_index: int,
+        unk0: int,
+        offy_fl: int,
+        offx_fl: int,
+        memory_offset: int,
+        palette_offset: int,
+    ) -> Tuple[MetaFrame, bool]:
+        """Build a meta-frame from its unpacked record fields. Returns (MetaFrame, is_last)."""
         mf = MetaFrame()
 
-        mf.image_index = read_int16(self.rawdata, offset)
-        mf.unk0 = read_uint16(self.rawdata, offset + 2)
-        offy_fl = read_uint16(self.rawdata, offset + 4)
-        offx_fl = read_uint16(self.rawdata, offset + 6)
-        mf.memory_offset = read_uint8(self.rawdata, offset + 8)
-        mf.palette_offset = read_uint8(self.rawdata, offset + 9)
+        mf.image_index = image_index
+        mf.unk0 = unk0
+        mf.memory_offset = memory_offset
+        mf.palette_offset = palette_offset
 
         mf.offset_y = offy_fl & 0x03FF
         mf.offset_x = offx_fl & 0x01FF
 
-        mf.resolution = _get_resolution_from_offsets(offx_fl, offy_fl)
+        # Resolution enum is built from the top 2 bits of each offset
+        mf.resolution = ((offy_fl & 0xC000) >> 8) | ((offx_fl & 0xC000) >> 12)
 
         mf.v_flip = (offx_fl >> 13) & 1
         mf.h_flip = (offx_fl >> 12) & 1
@@ -351,23 +423,17 @@ class WANParser:
             return []
 
         anim_groups = []
-        pos = self.wan_anim_info.ptr_anim_grp_table
-
-        for _ in range(self.wan_anim_info.nb_anim_groups):
-            ptr_grp = read_uint32(self.rawdata, pos)
-            nb_seqs = read_uint32(self.rawdata, pos + 4)
-            pos += 8
+        # Table of (ptr_grp, nb_seqs) pairs
+        grp_table = self._read_uint32_list(
+            self.wan_anim_info.ptr_anim_grp_table, self.wan_anim_info.nb_anim_groups * 2
+        )
 
+        for ptr_grp, nb_seqs in zip(grp_table[0::2], grp_table[1::2]):
             group = SpriteAnimationGroup()
 
             if ptr_grp != 0 and nb_seqs != 0:
-                seq_pos = ptr_grp
-                for _ in range(nb_seqs):
-                    seq_ptr = read_uint32(self.rawdata, seq_pos)
-                    group.seqs_indexes.append(
-                        seq_ptr
-                    )  # Store as pointer, will be converted to index later
-                    seq_pos += 4
+                # Store as pointers, converted to indexes by _read_anim_sequences
+                group.seqs_indexes = self._read_uint32_list(ptr_grp, nb_seqs)
 
             anim_groups.append(group)
 
@@ -396,26 +462,40 @@ class WANParser:
     def _read_anim_sequence(self, offset: int) -> AnimationSequence:
         """Read a single animation sequence."""
         seq = AnimationSequence()
-        pos = offset
-
-        while pos < len(self.rawdata):
-            frame = self._read_anim_frame(pos)
-            if frame.is_null():
+        data_len = len(self._mv)
+        record_len = _ANIM_FRAME_STRUCT.size
+        # Frames run until the null frame, bounded by the end of the data
+        nb_records = max(data_len - offset, 0) // record_len
+        records = self._mv[offset : offset + nb_records * record_len]
+
+        for fields in _ANIM_FRAME_STRUCT.iter_unpack(records):
+            if not any(fields):
                 break
-            seq.insert_frame(frame)
-            pos += WanFormat.LENGTH_ANIM_FRM
+            seq.insert_frame(self._decode_anim_frame(*fields))
+        else:
+            tail = offset + nb_records * record_len
+            if tail < data_len:
+                raise struct.error(f"Truncated animation frame at offset {tail:#x}")
 
         return seq
 
-    def _read_anim_frame(self, offset: int) -> AnimFrame:
-        """Read a single animation frame."""
+    def _decode_anim_frame(
+        self,
+        frame_duration: int,
+        meta_frm_grp_index: int,
+        spr_offset_x: int,
+        spr_offset_y: int,
+        shadow_offset_x: int,
+        shadow_offset_y: int,
+    ) -> AnimFrame:
+        """Build an animation frame from its unpacked record fields."""
         af = AnimFrame()
-        af.frame_duration = read_uint16(self.rawdata, offset)
-        af.meta_frm_grp_index = read_uint16(self.rawdata, offset + 2)
-        af.spr_offset_x = read_int16(self.rawdata, offset + 4)
-        af.spr_offset_y = read_int16(self.rawdata, offset + 6)
-        af.shadow_offset_x = read_int16(self.rawdata, offset + 8)
-        af.shadow_offset_y = read_int16(self.rawdata, offset + 10)
+        af.frame_duration = frame_duration
+        af.meta_frm_grp_index = meta_frm_grp_index
+        af.spr_offset_x = spr_offset_x
+        af.spr_offset_y = spr_offset_y
+        af.shadow_offset_x = shadow_offset_x
+        af.shadow_offset_y = shadow_offset_y
         return af
 
     def _read_particle_offsets(self) -> List[SprOffParticle]:
@@ -432,21 +512,17 @@ class WANParser:
 
         offset_beg_seq_table = self._calc_file_offset_beg_seq_table()
         offset_block_len = offset_beg_seq_table - self.wan_anim_info.ptr_p_offsets_table
-        nb_offsets = offset_block_len // 4
-
-        offsets = []
         pos = self.wan_anim_info.ptr_p_offsets_table
+        # Entries running past the end of the file are dropped
+        nb_offsets = min(offset_block_len // 4, (len(self._mv) - pos) // 4)
 
-        for _ in range(nb_offsets):
-            if pos + 4 > len(self.rawdata):
-                break
-            offset = SprOffParticle()
-            offset.offx = read_int16(self.rawdata, pos)
-            offset.offy = read_int16(self.rawdata, pos + 2)
-            offsets.append(offset)
-            pos += 4
+        if nb_offsets <= 0:
+            return []
 
-        return offsets
+        table = np.frombuffer(
+            self._mv, dtype=_PART_OFFSET_DTYPE, count=nb_offsets, offset=pos
+        )
+        return [SprOffParticle(offx, offy) for offx, offy in table.tolist()]
 
     def _calc_file_offset_beg_seq_table(self) -> int:
         """Calculate the beginning of the sequence table.
@@ -469,8 +545,9 @@ class WANParser:
             # Scan up to nb_anim_groups entries
             end_boundary = pos + (self.wan_anim_info.nb_anim_groups * 8)
 
+        data = self.rawdata
         while pos < end_boundary:
-            ptr_grp = read_uint32(self.rawdata, pos)
+            ptr_grp = read_uint32(data, pos)
             if ptr_grp == 0:
                 nb_null_groups += 1
                 pos += 8
@@ -505,37 +582,35 @@ class WANParser:
         Returns:
             Dictionary mapping frame_index -> (width, height)
         """
-        is_tiles_mode = sprite.spr_info.tiles_mode == 1
-        frame_dimension_map = {}
-
         if not sprite.metaframes:
-            return frame_dimension_map
+            return {}
+
+        special_id = WanFormat.SPECIAL_META_FRAME_ID
+        # Walking the meta-frames backwards lets later (earlier in file order) entries
+        # overwrite, so each key keeps its first occurrence in one comprehension pass
+        metaframes = reversed(sprite.metaframes)
 
-        if is_tiles_mode:
+        if sprite.spr_info.tiles_mode == 1:
             # Tiles mode: collect unique (memory_offset, width, height) and sort by offset
             # This gives us the frame order in the tilemap
-            offset_dimensions = {}
-            for mf in sprite.metaframes:
-                if mf.image_index == WanFormat.SPECIAL_META_FRAME_ID:
-                    offset = mf.memory_offset
-                    if offset not in offset_dimensions:
-                        width, height = enum_res_to_integer(mf.resolution)
-                        offset_dimensions[offset] = (width, height)
+            offset_dimensions = {
+                mf.memory_offset: _RES_DIMENSIONS[mf.resolution]
+                for mf in metaframes
+                if mf.image_index == special_id
+            }
 
             # Map sorted offsets to frame indices
-            for frame_idx, offset in enumerate(sorted(offset_dimensions.keys())):
-                frame_dimension_map[frame_idx] = offset_dimensions[offset]
-        else:
-            # Normal mode: map image_index directly to dimensions
-            for mf in sprite.metaframes:
-                if (
-                    mf.image_index != WanFormat.SPECIAL_META_FRAME_ID
-                    and mf.image_index not in frame_dimension_map
-                ):
-                    width, height = enum_res_to_integer(mf.resolution)
-                    frame_dimension_map[mf.image_index] = (width, height)
-
-        return frame_dimension_map
+            return {
+                frame_idx: offset_dimensions[offset]
+                for frame_idx, offset in enumerate(sorted(offset_dimensions))
+            }
+
+        # Normal mode: map image_index directly to dimensions
+        return {
+            mf.image_index: _RES_DIMENSIONS[mf.resolution]
+            for mf in metaframes
+            if mf.image_index != special_id
+        }
 
     def _determine_tile_arrangement(
         self,
@@ -559,31 +634,10 @@ class WANParser:
             if expected_tiles == num_tiles:
                 return expected_tiles_x, expected_tiles_y
 
-        if num_tiles == 0:
-            return (1, 1)
-        elif num_tiles == 1:
-            return (1, 1)
-        elif num_tiles == 4:
-            return (2, 2)
-        elif num_tiles == 8:
-            return (4, 2)  # Prefer landscape (4x2) over portrait (2x4)
-        elif num_tiles == 16:
-            return (4, 4)
-        else:
-            best_arrangement = None
-            best_score = float("inf")
-
-            for tiles_x in [1, 2, 4, 8, 16, 32]:
-                if num_tiles % tiles_x == 0:
-                    tiles_y = num_tiles // tiles_x
-                    aspect_ratio = max(tiles_x, tiles_y) / min(tiles_x, tiles_y)
-
-                    if aspect_ratio < best_score:
-                        best_score = aspect_ratio
-                        best_arrangement = (tiles_x, tiles_y)
-
-            result = best_arrangement if best_arrangement else (4, (num_tiles + 3) // 4)
-            return result
+        arrangement = _TILE_ARRANGEMENTS.get(num_tiles)
+        if arrangement is None:
+            arrangement = _fallback_tile_arrangement(num_tiles)
+        return arrangement
 
     def _read_images(self, sprite: BaseSprite, is_4bpp: bool) -> None:
         """Read images from the image table.
@@ -604,8 +658,9 @@ class WANParser:
         sprite.frames = []
         sprite.imgs_info = []
 
-        for i in range(nb_frames):
-            img_ptr = read_uint32(self.rawdata, img_tbl_offset + (i * 4))
+        img_ptrs = self._read_uint32_list(img_tbl_offset, nb_frames)
+
+        for i, img_ptr in enumerate(img_ptrs):
             img, z_index = self._read_image(
                 img_ptr,
                 i,
@@ -618,6 +673,22 @@ class WANParser:
             info.zindex = z_index
             sprite.imgs_info.append(info)
 
+    def _read_asm_table(self, offset: int) -> List[Tuple[int, int, int, int]]:
+        """Read an image assembly table as (pixelsrc, pixamt, unk14, z_index) rows."""
+        rows = []
+        data_len = len(self._mv)
+        pos = offset
+
+        while pos < data_len:
+            row = _ASM_ENTRY_STRUCT.unpack_from(self._mv, pos)
+            # The table ends at the first all-zero entry
+            if not (row[0] or row[1] or row[3]):
+                break
+            rows.append(row)
+            pos += _ASM_ENTRY_STRUCT.size
+
+        return rows
+
     def _read_image(
         self,
         offset: int,
@@ -638,63 +709,51 @@ class WANParser:
         """
         img = TiledImage()
 
-        asm_table = []
-        pos = offset
-
-        while pos < len(self.rawdata):
-            entry = ImgAsmTblEntry.read_from_bytes(self.rawdata, pos)
-            if entry.is_null():
-                break
-            asm_table.append(entry)
-            pos += 12
+        asm_table = self._read_asm_table(offset)
 
         if not asm_table:
             return img, 0
 
-        total_pixels = 0
-
-        for entry in asm_table:
-            if is_4bpp:
-                total_pixels += entry.pixamt * 2
-            else:
-                total_pixels += entry.pixamt
+        total_pixels = sum(row[1] for row in asm_table)
+        if is_4bpp:
+            total_pixels *= 2
 
         tiled_pixels = np.zeros(total_pixels, dtype=np.uint8)
         pixel_idx = 0
+        mv = self._mv
+        data_len = len(mv)
 
-        for entry in asm_table:
-            if entry.pixelsrc == 0:
-                pixel_idx += entry.pixamt * 2 if is_4bpp else entry.pixamt
+        for pixelsrc, pixamt, _, _ in asm_table:
+            if pixelsrc == 0:
+                pixel_idx += pixamt * 2 if is_4bpp else pixamt
             else:
-                src_offset = entry.pixelsrc
+                src_offset = pixelsrc
 
                 if is_4bpp:
-                    bytes_to_read = entry.pixamt
-                    end_offset = min(src_offset + bytes_to_read, len(self.rawdata))
+                    bytes_to_read = pixamt
+                    end_offset = min(src_offset + bytes_to_read, data_len)
 
-                    bytes_data = self.rawdata[src_offset:end_offset]
-                    arr = np.frombuffer(bytes_data, dtype=np.uint8)
+                    arr = np.frombuffer(mv[src_offset:end_offset], dtype=np.uint8)
 
-                    # WAN files use reversed pixel order: low nybble first
-                    low = arr & 0x0F
-                    high = (arr >> 4) & 0x0F
-                    unpacked = np.stack([low, high], axis=1).flatten()
-
-                    copy_len = len(unpacked)
-                    tiled_pixels[pixel_idx : pixel_idx + copy_len] = unpacked
+                    # WAN files use reversed pixel order: low nybble first.
+                    # Gather each byte's nybble pair straight into the output, byte
+                    # indexes are always in range so clip mode skips a buffered copy
+                    copy_len = len(arr) * 2
+                    out = tiled_pixels[pixel_idx : pixel_idx + copy_len]
+                    _NIBBLE_LUT.take(arr, axis=0, out=out.reshape(-1, 2), mode="clip")
                     pixel_idx += copy_len
 
                     remaining_bytes = bytes_to_read - (end_offset - src_offset)
                     if remaining_bytes > 0:
                         pixel_idx += remaining_bytes * 2
                 else:
-                    end_offset = min(src_offset + entry.pixamt, len(self.rawdata))
+                    end_offset = min(src_offset + pixamt, data_len)
                     copy_len = end_offset - src_offset
 
                     tiled_pixels[pixel_idx : pixel_idx + copy_len] = np.frombuffer(
-                        self.rawdata[src_offset:end_offset], dtype=np.uint8
+                        mv[src_offset:end_offset], dtype=np.uint8
                     )
-                    pixel_idx += entry.pixamt
+                    pixel_idx += pixamt
 
         num_tiles = (len(tiled_pixels) + TILE_AREA - 1) // TILE_AREA
 
@@ -707,28 +766,32 @@ class WANParser:
 
         actual_num_tiles = len(tiled_pixels) // TILE_AREA
 
-        if actual_num_tiles > 0:
-            tiles_3d = tiled_pixels[: actual_num_tiles * TILE_AREA].reshape(
-                actual_num_tiles, TILE_SIZE, TILE_SIZE
+        img.pixels = np.zeros((height, width), dtype=np.uint8)
+        num_placed = min(actual_num_tiles, num_tiles_x * num_tiles_y)
+
+        if num_placed > 0:
+            tiles_3d = tiled_pixels[: num_placed * TILE_AREA].reshape(
+                num_placed, TILE_SIZE, TILE_SIZE
             )
-            img.pixels = np.zeros((height, width), dtype=np.uint8)
-
-            tile_idx = 0
-            for tile_y in range(num_tiles_y):
-                y_start = tile_y * TILE_SIZE
-                y_end = min(y_start + TILE_SIZE, height)
-                for tile_x in range(num_tiles_x):
-                    if tile_idx >= actual_num_tiles:
-                        break
-                    x_start = tile_x * TILE_SIZE
-                    x_end = min(x_start + TILE_SIZE, width)
-                    img.pixels[y_start:y_end, x_start:x_end] = tiles_3d[
-                        tile_idx, : y_end - y_start, : x_end - x_start
-                    ]
-                    tile_idx += 1
-        else:
-            img.pixels = np.zeros((height, width), dtype=np.uint8)
 
-        z_index = asm_table[0].z_index if asm_table else 0
+            # Complete tile rows are laid out in one reshape/transpose
+            full_rows = num_placed // num_tiles_x
+            if full_rows:
+                img.pixels[: full_rows * TILE_SIZE] = (
+                    tiles_3d[: full_rows * num_tiles_x]
+                    .reshape(full_rows, num_tiles_x, TILE_SIZE, TILE_SIZE)
+                    .transpose(0, 2, 1, 3)
+                    .reshape(full_rows * TILE_SIZE, width)
+                )
+
+            # Ragged last row when the image data runs out early
+            y_start = full_rows * TILE_SIZE
+            for tile_idx in range(full_rows * num_tiles_x, num_placed):
+                x_start = (tile_idx - full_rows * num_tiles_x) * TILE_SIZE
+                img.pixels[
+                    y_start : y_start + TILE_SIZE, x_start : x_start + TILE_SIZE
+                ] = tiles_3d[tile_idx]
+
+        z_index = asm_table[0][3]
 
         return img, z_index
@@ -2,24 +2,27 @@
 WAN file writer for creating .wan sprite files.
 """
 
+import struct
 import numpy as np
 from pathlib import Path
 from typing import List, Optional, Tuple
-from .sprite import BaseSprite, AnimFrame
-from .constants import Sir0, PADDING_BYTE
+from .sprite import BaseSprite
+from .constants import Sir0, WanFormat, PADDING_BYTE
 from .sir0 import wrap_sir0
 from data import (
     write_uint32,
     write_uint16,
-    write_uint8,
     write_int16,
     write_bytes_to_file,
     align_offset,
     pad_bytes,
     TILE_SIZE,
-    TILE_AREA,
 )
 
+# On-disk meta-frame record: image index, unk0, Y offset/flags, X offset/flags,
+# memory offset, palette offset
+_META_FRAME_STRUCT = struct.Struct("<hHHHBB")
+
 
 def _calculate_tile_dimensions(
     width: int, height: int, tile_size: int = TILE_SIZE
@@ -51,14 +54,6 @@ def _write_meta_frame_to_wan(mf, set_last_bit: bool = False) -> bytes:
     Returns:
         Bytes representation of the meta-frame (10 bytes)
     """
-    result = bytearray()
-
-    # Special metaframe index (0xFFFF) must be encoded as -1 in signed int16
-    img_idx = mf.image_index
-    result.extend(write_int16(img_idx))
-
-    result.extend(write_uint16(mf.unk0))
-
     resval = mf.resolution & 0xFF
     endbit_val = int(set_last_bit)
 
@@ -71,7 +66,6 @@ def _write_meta_frame_to_wan(mf, set_last_bit: bool = False) -> bytes:
         | (mf.const0_y_off_bit6 << 10)
         | (mf.offset_y & 0x03FF)
     )
-    result.extend(write_uint16(y_offset))
 
     # XOffset bit layout: [15:14]=res[3:2], [13]=vFlip, [12]=hFlip, [11]=Endbit, [10]=IsAbsPal, [9]=XOffbit7, [8:0]=offsetX
     x_offset = (
@@ -83,11 +77,16 @@ def _write_meta_frame_to_wan(mf, set_last_bit: bool = False) -> bytes:
         | (mf.const0_x_off_bit7 << 9)
         | (mf.offset_x & 0x01FF)
     )
-    result.extend(write_uint16(x_offset))
-    result.extend(write_uint8(mf.memory_offset))
-    result.extend(write_uint8(mf.palette_offset))
 
-    return bytes(result)
+    # Special metaframe index (0xFFFF) must be encoded as -1 in signed int16
+    return _META_FRAME_STRUCT.pack(
+        mf.image_index,
+        mf.unk0,
+        y_offset,
+        x_offset,
+        mf.memory_offset,
+        mf.palette_offset,
+    )
 
 
 class WANWriter:
@@ -319,17 +318,23 @@ class WANWriter:
         metaframes = self.sprite.metaframes
         groups = self.sprite.metaframe_groups
 
+        nb_metaframes = len(metaframes)
+
         for group in groups:
             group_offset = len(self.output_buffer)
             self.meta_frame_group_offsets.append(group_offset)
 
-            for frame_idx, mf_idx in enumerate(group.metaframes):
-                if mf_idx < len(metaframes):
-                    mf = metaframes[mf_idx]
-                    is_last = frame_idx == len(group.metaframes) - 1
-
-                    mf_bytes = _write_meta_frame_to_wan(mf, set_last_bit=is_last)
-                    self.output_buffer.extend(mf_bytes)
+            # Pack the whole group, then append it to the output in one copy
+            last_idx = len(group.metaframes) - 1
+            self.output_buffer += b"".join(
+                [
+                    _write_meta_frame_to_wan(
+                        metaframes[mf_idx], set_last_bit=frame_idx == last_idx
+                    )
+                    for frame_idx, mf_idx in enumerate(group.metaframes)
+                    if mf_idx < nb_metaframes
+                ]
+            )
 
     def _write_anim_sequences(self) -> None:
         """Write animation sequences block (deduplicated)."""
@@ -350,20 +355,10 @@ class WANWriter:
                     written_sequences.add(seq_idx)
 
                     if seq_idx < len(anim_sequences):
+                        # All frames of the sequence in one copy, then the null frame
                         seq = anim_sequences[seq_idx]
-                        for af in seq.frames:
-                            self._write_anim_frame(af)
-                        null_frame = AnimFrame()
-                        self._write_anim_frame(null_frame)
-
-    def _write_anim_frame(self, af: AnimFrame) -> None:
-        """Write a single animation frame (12 bytes total)."""
-        self.output_buffer.extend(write_uint16(af.frame_duration))
-        self.output_buffer.extend(write_uint16(af.meta_frm_grp_index))
-        self.output_buffer.extend(write_int16(af.spr_offset_x))
-        self.output_buffer.extend(write_int16(af.spr_offset_y))
-        self.output_buffer.extend(write_int16(af.shadow_offset_x))
-        self.output_buffer.extend(write_int16(af.shadow_offset_y))
+                        self.output_buffer.extend(seq.to_records().tobytes())
+                        self.output_buffer.extend(bytes(WanFormat.LENGTH_ANIM_FRM))
 
     def _write_meta_frame_group_ptr_table(self) -> None:
         """Write meta-frame group pointer table."""
@@ -470,51 +465,30 @@ class WANWriter:
         height, width = pixels_2d.shape
 
         num_tiles_x, num_tiles_y = _calculate_tile_dimensions(width, height, TILE_SIZE)
-        num_tiles = num_tiles_x * num_tiles_y
-
-        pixels = np.zeros(num_tiles * TILE_AREA, dtype=np.uint8)
-        tile_idx = 0
-
-        for tile_y in range(num_tiles_y):
-            y_start = tile_y * TILE_SIZE
-            y_end = min(y_start + TILE_SIZE, height)
-            for tile_x in range(num_tiles_x):
-                x_start = tile_x * TILE_SIZE
-                x_end = min(x_start + TILE_SIZE, width)
-                tile = pixels_2d[y_start:y_end, x_start:x_end]
-
-                if tile.shape == (TILE_SIZE, TILE_SIZE):
-                    pixels[tile_idx * TILE_AREA : (tile_idx + 1) * TILE_AREA] = (
-                        tile.flatten()
-                    )
-                else:
-                    padded_tile = np.zeros((TILE_SIZE, TILE_SIZE), dtype=np.uint8)
-                    padded_tile[: tile.shape[0], : tile.shape[1]] = tile
-                    pixels[tile_idx * TILE_AREA : (tile_idx + 1) * TILE_AREA] = (
-                        padded_tile.flatten()
-                    )
 
-                tile_idx += 1
-        pixels_len = len(pixels)
-
-        if is_4bpp:
-            arr = pixels & 0x0F
-            result_size = (pixels_len + 1) // 2
-            result = np.zeros(result_size, dtype=np.uint8)
-
-            # WAN files use reversed pixel order: low nybble first
-            pairs = pixels_len // 2
-            if pairs > 0:
-                low = arr[::2][:pairs]
-                high = arr[1::2][:pairs]
-                result[:pairs] = (low | (high << 4)).astype(np.uint8)
-            if pixels_len % 2:
-                result[pairs] = arr[pairs * 2] & 0x0F
-            result = result.tobytes()
+        padded_height = num_tiles_y * TILE_SIZE
+        padded_width = num_tiles_x * TILE_SIZE
+        is_tile_aligned = (height, width) == (padded_height, padded_width)
+        if is_tile_aligned and pixels_2d.dtype == np.uint8:
+            padded = pixels_2d
         else:
-            result = pixels.tobytes()
+            # Zero-pad partial edge tiles up to a whole number of tiles
+            padded = np.zeros((padded_height, padded_width), dtype=np.uint8)
+            padded[:height, :width] = pixels_2d
+
+        # Reorder rows of pixels into consecutive 8x8 tiles, row-major within each tile
+        pixels = (
+            padded.reshape(num_tiles_y, TILE_SIZE, num_tiles_x, TILE_SIZE)
+            .transpose(0, 2, 1, 3)
+            .reshape(-1)
+        )
+        if not is_4bpp:
+            return pixels.tobytes()
 
-        return bytes(result)
+        # Whole tiles always hold an even pixel count. WAN files use reversed pixel
+        # order: low nybble first, and the uint8 shift drops the high pixel's top bits
+        paired = pixels.reshape(-1, 2)
+        return ((paired[:, 0] & 0x0F) | (paired[:, 1] << 4)).tobytes()
 
     def _build_tile_aligned_entries(self, pixel_data: bytes, is_4bpp: bool) -> list:
         """
@@ -555,20 +529,17 @@ class WANWriter:
         # Vectorized check: which tiles are all zeros? O(num_tiles) instead of O(num_bytes)
         is_zero = ~np.any(tiles, axis=1)
 
-        # Build entries by grouping consecutive same-type tiles
-        entries = []
-        i = 0
-        while i < num_complete_tiles:
-            tile_is_zero = is_zero[i]
-            start_tile = i
-
-            # Count consecutive tiles of same type
-            while i < num_complete_tiles and is_zero[i] == tile_is_zero:
-                i += 1
+        # Runs of same-type tiles start wherever the zero flag changes
+        run_bounds = np.flatnonzero(is_zero[1:] != is_zero[:-1]) + 1
+        run_starts = [0] + run_bounds.tolist()
+        run_ends = run_bounds.tolist() + [num_complete_tiles]
 
-            num_tiles_in_group = i - start_tile
+        entries = []
+        for start_tile, end_tile, tile_is_zero in zip(
+            run_starts, run_ends, is_zero[run_starts].tolist()
+        ):
             byte_start = start_tile * tile_bytes
-            byte_count = num_tiles_in_group * tile_bytes
+            byte_count = (end_tile - start_tile) * tile_bytes
 
             if tile_is_zero:
                 entries.append(